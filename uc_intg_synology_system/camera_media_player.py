@@ -6,12 +6,37 @@ Camera Media Player entity - not implemeneted due to large complex versions of c
 """
 
 import asyncio
-import base64
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import os
+import socket
 import time
+from dataclasses import dataclass
 from typing import Any, Dict, List
 
+try:
+    # SIMD-accelerated base64 codec (AVX2/AVX-512), 5-12x faster than stdlib
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+try:
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import io
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from cachetools import LRUCache, TTLCache
+
 import ucapi
 from ucapi import StatusCodes
 from ucapi.media_player import Attributes, Commands, Features, MediaPlayer, States
@@ -22,6 +47,27 @@ from uc_intg_synology_system.helpers import create_two_line_display, safe_get_ne
 
 _LOG = logging.getLogger(__name__)
 
+# Pre-formatted data-URL prefixes so the hot encode path skips the f-string build
+_JPEG_PREFIX = "data:image/jpeg;base64,"
+_PNG_PREFIX = "data:image/png;base64,"
+_WEBP_PREFIX = "data:image/webp;base64,"
+
+# Port for the optional local snapshot HTTP server (snapshot_http_server feature)
+_SNAPSHOT_SERVER_PORT = 8787
+
+# Constant for the process lifetime - avoids recomputing paths per call
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+_FALLBACK_ICONS = ("surveillance_status.png", "synology_logo.png")
+
+# Icons pre-loaded at startup so status updates never touch the filesystem
+_ICON_FILES = (
+    "surveillance_status.png",
+    "synology_logo.png",
+    "camera_recording.png",
+    "camera_online.png",
+    "camera_offline.png",
+)
+
 # CRITICAL: Commands to suppress to prevent red error messages
 SUPPRESSED_COMMANDS = [
     Commands.PLAY_PAUSE,
@@ -40,9 +86,31 @@ SUPPRESSED_COMMANDS = [
 ]
 
 
+@dataclass(slots=True)
+class CameraInfo:
+    """Per-camera record; slotted to keep many cameras compact and attribute access fast."""
+    id: str
+    name: str
+    enabled: bool
+    status: int
+    recording: bool
+    ip: str
+    model: str
+
+
 class SynologyCameraMonitor:
     """Synology camera monitoring using HOME ASSISTANT exact method."""
 
+    __slots__ = (
+        "_api", "_client", "_config", "_current_camera", "_cameras",
+        "_camera_id_to_name", "_source_list", "_polling_task", "_icon_cache",
+        "_snapshot_cache", "_snapshot_fingerprints", "_snapshot_raw",
+        "_http_runner", "_http_base_url", "_poll_now", "_last_schedule",
+        "_status_arr", "_recording_arr", "_last_pushed_attrs", "_io_executor",
+        "_snapshot_sem", "_camera_list_cache", "_camera_list_lock",
+        "snapshot_quality", "_webp_snapshots", "_entity",
+    )
+
     def __init__(self, api: ucapi.IntegrationAPI, client: SynologySystemClient, config: SynologyConfig):
         """Initialize camera monitor."""
         self._api = api
@@ -51,30 +119,65 @@ class SynologyCameraMonitor:
         self._current_camera = "All Cameras"
         self._cameras = {}
         self._camera_id_to_name = {}
+        self._source_list = ["All Cameras"]
         self._polling_task = None
-        self._icon_cache = {}
-        self._snapshot_cache = {}
+        self._icon_cache = LRUCache(maxsize=16)
+        self._snapshot_cache = TTLCache(maxsize=64, ttl=30)
+        self._snapshot_fingerprints = {}  # camera_id -> (fingerprint, data_url) for frame dedup
+        self._snapshot_raw = {}  # camera_id -> (etag, jpeg bytes) backing the snapshot HTTP server
+        self._http_runner = None
+        self._http_base_url = None
+        self._poll_now = 0.0  # monotonic timestamp sampled once per update cycle
+        self._last_schedule = {}  # camera_id -> raw recordSchedule string, skips rescans when stable
+        # Structure-of-arrays mirror of camera status/recording flags for C-level aggregate counts
+        self._status_arr: List[int] = []
+        self._recording_arr: List[bool] = []
+        self._last_pushed_attrs: Dict[str, Any] = {}  # snapshot of last pushed attributes for diffing
+        # Surveillance Station calls are synchronous HTTP - run them off the event loop
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="syno-cam")
+        self._snapshot_sem = asyncio.Semaphore(4)
+        self._camera_list_cache = None  # (monotonic ts, cameras list) shared by discovery + status polls
+        self._camera_list_lock = asyncio.Lock()
         
         self.snapshot_quality = "MEDIUM"
+        # Opt-in WebP transcode: 25-40% smaller snapshots, but not every target renders WebP
+        self._webp_snapshots = PIL_AVAILABLE and config.enabled_features.get("webp_snapshots", False)
         
         _LOG.info("Initializing camera monitor with HOME ASSISTANT method")
-        
+
+        # Pre-cache every known icon so _get_status_icon is a pure dict lookup
+        for icon_file in _ICON_FILES:
+            self._get_camera_icon_base64(icon_file)
+
         self._entity = self._create_camera_media_player()
 
-    async def _discover_cameras(self) -> Dict[str, Dict[str, Any]]:
+    async def _cached_camera_list(self, ttl: float = 5.0) -> List[Dict[str, Any]]:
+        """Fetch the camera list with a short TTL cache, coalescing concurrent callers."""
+        async with self._camera_list_lock:
+            now = time.monotonic()
+            if self._camera_list_cache and (now - self._camera_list_cache[0]) < ttl:
+                return self._camera_list_cache[1]
+
+            cameras_data = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor, self._client._surveillance.camera_list
+            )
+
+            if not cameras_data or not cameras_data.get('success', False):
+                _LOG.warning("Camera list API call unsuccessful")
+                return []
+
+            cameras_raw = safe_get_nested_value(cameras_data, ['data', 'cameras'], [])
+            self._camera_list_cache = (now, cameras_raw)
+            return cameras_raw
+
+    async def _discover_cameras(self) -> Dict[str, CameraInfo]:
         """Camera discovery using working method."""
         if not self._client._surveillance:
             _LOG.warning("Surveillance Station not available")
             return {}
-        
+
         try:
-            cameras_data = self._client._surveillance.camera_list()
-            
-            if not cameras_data or not cameras_data.get('success', False):
-                _LOG.warning("Camera list API call unsuccessful")
-                return {}
-            
-            cameras_raw = safe_get_nested_value(cameras_data, ['data', 'cameras'], [])
+            cameras_raw = await self._cached_camera_list()
             if not cameras_raw:
                 _LOG.warning("No cameras found in API response")
                 return {}
@@ -83,30 +186,35 @@ class SynologyCameraMonitor:
             self._camera_id_to_name = {}
             
             for camera in cameras_raw:
-                camera_id = str(camera.get('id', ''))
-                camera_name = camera.get('newName', f'Camera {camera_id}')
-                if not camera_name or camera_name.strip() == '':
-                    camera_name = f'Camera {camera_id}'
-                
-                camera_status = camera.get('status', 0)
-                record_schedule = camera.get('recordSchedule', '')
+                get = camera.get
+                camera_id = str(get('id', ''))
+                default_name = f'Camera {camera_id}'
+                camera_name = get('newName') or default_name
+                if not camera_name.strip():
+                    camera_name = default_name
+
+                camera_status = get('status', 0)
+                record_schedule = get('recordSchedule', '')
                 is_recording = len(record_schedule) > 100 and '1' in record_schedule
-                camera_ip = camera.get('ip', '')
-                
-                camera_dict[camera_name] = {
-                    "id": camera_id,
-                    "name": camera_name,
-                    "enabled": True,
-                    "status": camera_status,
-                    "recording": is_recording,
-                    "ip": camera_ip,
-                    "model": camera.get('model', 'Unknown')
-                }
-                
+                self._last_schedule[camera_id] = record_schedule
+
+                camera_dict[camera_name] = CameraInfo(
+                    id=camera_id,
+                    name=camera_name,
+                    enabled=True,
+                    status=camera_status,
+                    recording=is_recording,
+                    ip=get('ip', ''),
+                    model=get('model', 'Unknown')
+                )
+
                 self._camera_id_to_name[camera_id] = camera_name
-                
-                _LOG.info(f"Found camera: {camera_name} (ID: {camera_id}) - Status: {camera_status}")
+
+                _LOG.debug(f"Found camera: {camera_name} (ID: {camera_id}) - Status: {camera_status}")
             
+            # Sorted once here instead of on every source-list request
+            self._source_list = ["All Cameras", *sorted(k for k in camera_dict if k != "All Cameras")]
+
             _LOG.info(f"Successfully discovered {len(camera_dict)} cameras")
             return camera_dict
             
@@ -115,101 +223,119 @@ class SynologyCameraMonitor:
             return {}
 
     async def _get_camera_snapshot_home_assistant_method(self, camera_name: str) -> str:
-        camera_info = self._cameras.get(camera_name, {})
-        camera_id = camera_info.get('id', '')
-        
+        camera_info = self._cameras.get(camera_name)
+        camera_id = camera_info.id if camera_info else ''
+
         if not camera_id:
             return ""
         
-        # Check cache first (30 second cache)
+        # TTLCache expires entries itself (30 second TTL)
         cache_key = f"snapshot_{camera_id}"
-        cached_snapshot = self._snapshot_cache.get(cache_key, {})
-        current_time = time.time()
-        
-        if cached_snapshot and (current_time - cached_snapshot.get('timestamp', 0)) < 30:
-            return cached_snapshot.get('data', '')
-        
-        try:
-            if hasattr(self._client._surveillance, 'get_camera_image'):
-                try:
-                    camera_id_int = int(camera_id)
-                    image_bytes = await self._client._surveillance.get_camera_image(
-                        camera_id_int, self.snapshot_quality
-                    )
+        cached_snapshot = self._snapshot_cache.get(cache_key)
+        if cached_snapshot is not None:
+            return cached_snapshot
+
+        # Bounded fan-out: at most 4 snapshot fetches in flight at once
+        async with self._snapshot_sem:
+            try:
+                def encode_frame(image_bytes: bytes) -> str:
+                    # Skip the base64 encode entirely when the camera returned the
+                    # same frame bytes as last time (common for idle scenes)
+                    fp = hashlib.blake2b(image_bytes, digest_size=8).digest()
+                    last_fp, last_url = self._snapshot_fingerprints.get(camera_id, (None, ''))
+                    if fp == last_fp:
+                        return last_url
+                    self._snapshot_raw[camera_id] = (fp.hex(), image_bytes)
+                    if self._http_base_url:
+                        # Snapshot server active: hand out a tiny URL, no base64 at all
+                        data_url = f"{self._http_base_url}/snapshot/{camera_id}?v={fp.hex()}"
+                    else:
+                        prefix = _JPEG_PREFIX
+                        if self._webp_snapshots:
+                            webp_bytes = self._transcode_webp(image_bytes)
+                            if webp_bytes:
+                                image_bytes = webp_bytes
+                                prefix = _WEBP_PREFIX
+                        data_url = prefix + _b64encode(image_bytes).decode('ascii')
+                    self._snapshot_fingerprints[camera_id] = (fp, data_url)
+                    return data_url
+
+                if hasattr(self._client._surveillance, 'get_camera_image'):
+                    try:
+                        camera_id_int = int(camera_id)
+                        image_bytes = await self._client._surveillance.get_camera_image(
+                            camera_id_int, self.snapshot_quality
+                        )
                     
-                    if isinstance(image_bytes, bytes) and len(image_bytes) > 100:
-                        base64_data = base64.b64encode(image_bytes).decode('utf-8')
-                        data_url = f"data:image/jpeg;base64,{base64_data}"
-                        
-                        self._snapshot_cache[cache_key] = {
-                            'data': data_url,
-                            'timestamp': current_time
-                        }
-                        
-                        _LOG.info(f"✅ HOME ASSISTANT method worked for {camera_name}: {len(image_bytes)} bytes")
-                        return data_url
+                        if isinstance(image_bytes, bytes) and len(image_bytes) > 100:
+                            data_url = encode_frame(image_bytes)
+
+                            self._snapshot_cache[cache_key] = data_url
+
+                            _LOG.info(f"✅ HOME ASSISTANT method worked for {camera_name}: {len(image_bytes)} bytes")
+                            return data_url
                         
-                except Exception as ha_ex:
-                    _LOG.debug(f"HOME ASSISTANT get_camera_image failed for {camera_name}: {ha_ex}")
+                    except Exception as ha_ex:
+                        _LOG.debug(f"HOME ASSISTANT get_camera_image failed for {camera_name}: {ha_ex}")
             
-            if hasattr(self._client._surveillance, 'get_snapshot'):
-                try:
-                    snapshot_data = self._client._surveillance.get_snapshot(camera_id)
+                if hasattr(self._client._surveillance, 'get_snapshot'):
+                    try:
+                        snapshot_data = await asyncio.get_running_loop().run_in_executor(
+                            self._io_executor, self._client._surveillance.get_snapshot, camera_id
+                        )
                     
-                    if isinstance(snapshot_data, bytes) and len(snapshot_data) > 100:
-                        base64_data = base64.b64encode(snapshot_data).decode('utf-8')
-                        data_url = f"data:image/jpeg;base64,{base64_data}"
-                        
-                        self._snapshot_cache[cache_key] = {
-                            'data': data_url,
-                            'timestamp': current_time
-                        }
-                        
-                        _LOG.info(f"✅ Fallback get_snapshot worked for {camera_name}: {len(snapshot_data)} bytes")
-                        return data_url
+                        if isinstance(snapshot_data, bytes) and len(snapshot_data) > 100:
+                            data_url = encode_frame(snapshot_data)
+
+                            self._snapshot_cache[cache_key] = data_url
+
+                            _LOG.info(f"✅ Fallback get_snapshot worked for {camera_name}: {len(snapshot_data)} bytes")
+                            return data_url
                         
-                except Exception as fallback_ex:
-                    _LOG.debug(f"Fallback get_snapshot failed for {camera_name}: {fallback_ex}")
+                    except Exception as fallback_ex:
+                        _LOG.debug(f"Fallback get_snapshot failed for {camera_name}: {fallback_ex}")
             
-            _LOG.debug(f"No working snapshot method for camera {camera_name}")
-            return ""
+                _LOG.debug(f"No working snapshot method for camera {camera_name}")
+                return ""
             
-        except Exception as ex:
-            _LOG.error(f"Error getting snapshot for camera {camera_name}: {ex}")
-            return ""
+            except Exception as ex:
+                _LOG.error(f"Error getting snapshot for camera {camera_name}: {ex}")
+                return ""
+
+    async def _fetch_all_snapshots(self) -> None:
+        """Prefetch snapshots for all cameras in parallel (bounded by the semaphore)."""
+        await asyncio.gather(
+            *[self._get_camera_snapshot_home_assistant_method(name) for name in self._cameras],
+            return_exceptions=True
+        )
 
-    def _get_camera_sources(self) -> List[str]:
-        """Get camera sources list."""
-        sources = ["All Cameras"]
-        for camera_name in sorted(self._cameras.keys()):
-            if camera_name != "All Cameras":
-                sources.append(camera_name)
-        return sources
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolve_icon_path(icon_filename: str) -> str:
+        """Resolve an icon filename to an existing path (memoized)."""
+        icon_path = os.path.join(_ICON_DIR, icon_filename)
+        if os.path.exists(icon_path):
+            return icon_path
+        for fallback in _FALLBACK_ICONS:
+            fallback_path = os.path.join(_ICON_DIR, fallback)
+            if os.path.exists(fallback_path):
+                return fallback_path
+        return ""
 
     def _get_camera_icon_base64(self, icon_filename: str) -> str:
         """Get base64 encoded camera icon."""
         if icon_filename in self._icon_cache:
             return self._icon_cache[icon_filename]
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_dir = os.path.join(script_dir, "icons")
-        icon_path = os.path.join(icon_dir, icon_filename)
-        
-        fallback_icons = ["surveillance_status.png", "synology_logo.png"]
-        
-        if not os.path.exists(icon_path):
-            for fallback in fallback_icons:
-                icon_path = os.path.join(icon_dir, fallback)
-                if os.path.exists(icon_path):
-                    break
-            else:
-                return ""
+        icon_path = self._resolve_icon_path(icon_filename)
+        if not icon_path:
+            return ""
 
         try:
             with open(icon_path, 'rb') as f:
                 icon_data = f.read()
-                base64_data = base64.b64encode(icon_data).decode('utf-8')
-                data_url = f"data:image/png;base64,{base64_data}"
+                base64_data = _b64encode(icon_data).decode('ascii')
+                data_url = _PNG_PREFIX + base64_data
                 self._icon_cache[icon_filename] = data_url
                 return data_url
         except Exception as e:
@@ -221,9 +347,9 @@ class SynologyCameraMonitor:
         if camera_name == "All Cameras":
             return self._get_camera_icon_base64("surveillance_status.png")
         
-        camera_info = self._cameras.get(camera_name, {})
-        status = camera_info.get('status', 0)
-        recording = camera_info.get('recording', False)
+        camera_info = self._cameras.get(camera_name)
+        status = camera_info.status if camera_info else 0
+        recording = camera_info.recording if camera_info else False
         
         if status == 1 and recording:
             return self._get_camera_icon_base64("camera_recording.png")
@@ -263,6 +389,18 @@ class SynologyCameraMonitor:
             cmd_handler=self.handle_command
         )
 
+    def _push_attributes(self) -> None:
+        """Push only the attributes that changed since the last push.
+
+        The image URL is a base64 blob of up to several hundred KB; diffing
+        against the previous push keeps idle updates down to a few bytes.
+        """
+        attrs = self._entity.attributes
+        delta = {k: v for k, v in attrs.items() if self._last_pushed_attrs.get(k) != v}
+        if delta:
+            self._api.configured_entities.update_attributes(self.entity_id, delta)
+            self._last_pushed_attrs.update(delta)
+
     async def handle_command(self, entity_arg: ucapi.entity.Entity, cmd_id: str, params: Dict[str, Any] = None) -> StatusCodes:
         """Handle camera media player commands."""
         try:
@@ -300,32 +438,45 @@ class SynologyCameraMonitor:
             self._current_camera = camera_source
             self._entity.attributes[Attributes.SOURCE] = camera_source
             await self._update_camera_display()
-            self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+            self._push_attributes()
 
     async def _handle_camera_on(self) -> None:
         """Start camera monitoring."""
         self._entity.attributes[Attributes.STATE] = States.PLAYING
         await self.start()
-        self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+        self._push_attributes()
 
     async def _handle_camera_off(self) -> None:
         """Stop camera monitoring."""
         await self.stop()
         self._entity.attributes[Attributes.STATE] = States.PAUSED
+        self._last_pushed_attrs[Attributes.STATE] = States.PAUSED
         self._api.configured_entities.update_attributes(self.entity_id, {Attributes.STATE: States.PAUSED})
 
     async def _update_camera_display(self) -> None:
         """Update camera display based on current selection."""
+        self._poll_now = time.monotonic()
         if self._current_camera == "All Cameras":
             await self._update_all_cameras_display()
         else:
             await self._update_single_camera_display(self._current_camera)
 
+    def _rebuild_aggregate_arrays(self) -> None:
+        """Rebuild the parallel status/recording arrays from the camera map."""
+        cameras = self._cameras.values()
+        self._status_arr = [cam.status for cam in cameras]
+        self._recording_arr = [cam.recording for cam in cameras]
+
     async def _update_all_cameras_display(self) -> None:
         """Update display showing all cameras overview."""
+        # Warm the snapshot cache for every camera in parallel (bounded by
+        # the semaphore) so switching from the overview to any single camera
+        # renders its snapshot from cache instead of paying a fresh RTT
+        await self._fetch_all_snapshots()
+
         total_cameras = len(self._cameras)
-        recording_cameras = sum(1 for cam in self._cameras.values() if cam.get('recording', False))
-        online_cameras = sum(1 for cam in self._cameras.values() if cam.get('status', 0) == 1)
+        recording_cameras = sum(self._recording_arr)
+        online_cameras = self._status_arr.count(1)
         
         line1 = f"Surveillance - {total_cameras} cameras"
         line2 = f"Online: {online_cameras} | Recording: {recording_cameras}"
@@ -333,27 +484,42 @@ class SynologyCameraMonitor:
         self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
         self._entity.attributes[Attributes.MEDIA_IMAGE_URL] = self._get_status_icon("All Cameras")
 
+    @staticmethod
+    def _transcode_webp(image_bytes: bytes) -> bytes:
+        """Recompress a JPEG frame as WebP; returns b'' when transcoding fails."""
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            buf = io.BytesIO()
+            img.save(buf, format="WEBP", quality=70, method=4)
+            return buf.getvalue()
+        except Exception as ex:
+            _LOG.debug(f"WebP transcode failed, keeping JPEG: {ex}")
+            return b""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _format_display(camera_name: str, status: int, recording: bool, ip: str) -> tuple:
+        """Build the two display lines for a camera (memoized - inputs rarely change)."""
+        status_text = "Online" if status == 1 else "Offline"
+        recording_text = "Recording" if recording else "Idle"
+        line1 = f"{camera_name} - {status_text}"
+        line2 = f"{recording_text} | IP: {ip}"
+        return create_two_line_display(line1, line2)
+
     async def _update_single_camera_display(self, camera_name: str) -> None:
         """Update display for single camera with HOME ASSISTANT snapshot method."""
-        camera_info = self._cameras.get(camera_name, {})
-        
+        camera_info = self._cameras.get(camera_name)
+
         if not camera_info:
             return
-        
-        camera_id = camera_info.get('id', '')
-        recording = camera_info.get('recording', False)
-        status = camera_info.get('status', 0)
-        enabled = camera_info.get('enabled', False)
-        camera_ip = camera_info.get('ip', '')
-        
-        # Status text
-        status_text = "Online" if status == 1 else "Offline"
-        recording_text = "Recording" if recording else "Idle"
-        
-        line1 = f"{camera_name} - {status_text}"
-        line2 = f"{recording_text} | IP: {camera_ip}"
-        
-        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+
+        status = camera_info.status
+        recording = camera_info.recording
+        enabled = camera_info.enabled
+        camera_ip = camera_info.ip
+
+        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = \
+            self._format_display(camera_name, status, recording, camera_ip)
         
         # HOME ASSISTANT: Try snapshot for online cameras
         if status == 1 and enabled:
@@ -369,19 +535,18 @@ class SynologyCameraMonitor:
         """Refresh current camera display."""
         await self._update_camera_status()
         await self._update_camera_display()
-        self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+        self._push_attributes()
 
-    async def _update_camera_status(self) -> None:
-        """Update camera status."""
+    async def _update_camera_status(self) -> bool:
+        """Update camera status. Returns True when any camera state changed."""
+        changed = False
         if not self._client._surveillance:
-            return
-        
+            return changed
+
         try:
-            cameras_data = self._client._surveillance.camera_list()
-            
-            if cameras_data and cameras_data.get('success', False):
-                cameras_raw = safe_get_nested_value(cameras_data, ['data', 'cameras'], [])
-                
+            cameras_raw = await self._cached_camera_list()
+
+            if cameras_raw:
                 for camera in cameras_raw:
                     camera_id = str(camera.get('id', ''))
                     camera_name = camera.get('newName', f'Camera {camera_id}')
@@ -389,24 +554,48 @@ class SynologyCameraMonitor:
                     if camera_name in self._cameras:
                         camera_status = camera.get('status', 0)
                         record_schedule = camera.get('recordSchedule', '')
-                        is_recording = len(record_schedule) > 100 and '1' in record_schedule
-                        
-                        self._cameras[camera_name].update({
-                            "status": camera_status,
-                            "recording": is_recording
-                        })
-                        
+                        # Only rescan the ~168-char weekly schedule when it changed
+                        cam = self._cameras[camera_name]
+                        if self._last_schedule.get(camera_id) == record_schedule:
+                            is_recording = cam.recording
+                        else:
+                            is_recording = len(record_schedule) > 100 and '1' in record_schedule
+                            self._last_schedule[camera_id] = record_schedule
+
+                        if cam.status != camera_status or cam.recording != is_recording:
+                            changed = True
+                        cam.status = camera_status
+                        cam.recording = is_recording
+
+                if changed:
+                    self._rebuild_aggregate_arrays()
+
         except Exception as ex:
             _LOG.error(f"Error updating camera status: {ex}")
 
+        return changed
+
     async def _camera_polling_loop(self) -> None:
-        """Camera monitoring polling loop."""
+        """Camera monitoring loop: cheap status checks, display work only on real transitions.
+
+        Surveillance Station's event-push API is not exposed by the underlying
+        library, so the loop still polls camera_list, but the expensive
+        re-render/re-encode/push path runs only when camera state actually
+        changed, when a single camera view needs a fresh snapshot, or on the
+        5-minute reconciliation tick.
+        """
         _LOG.info("Camera polling loop started")
+        last_full_refresh = time.monotonic()
         while True:
             try:
-                await self._update_camera_status()
-                await self._update_camera_display()
-                self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+                self._poll_now = time.monotonic()
+                changed = await self._update_camera_status()
+                now = self._poll_now
+                reconcile = (now - last_full_refresh) >= 300
+                if changed or reconcile or self._current_camera != "All Cameras":
+                    await self._update_camera_display()
+                    self._push_attributes()
+                    last_full_refresh = now
                 await asyncio.sleep(20)
             except asyncio.CancelledError:
                 _LOG.info("Camera polling loop cancelled")
@@ -418,12 +607,12 @@ class SynologyCameraMonitor:
     async def initialize_cameras(self) -> bool:
         """Initialize camera discovery."""
         self._cameras = await self._discover_cameras()
-        
+        self._rebuild_aggregate_arrays()
+
         if not self._cameras:
             return False
         
-        camera_sources = self._get_camera_sources()
-        self._entity.attributes[Attributes.SOURCE_LIST] = camera_sources
+        self._entity.attributes[Attributes.SOURCE_LIST] = self._source_list
         
         _LOG.info(f"Initialized {len(self._cameras)} cameras")
         return True
@@ -433,21 +622,81 @@ class SynologyCameraMonitor:
         try:
             if await self.initialize_cameras():
                 await self._update_camera_display()
-                self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+                self._push_attributes()
                 await self.start()
             else:
                 self._entity.attributes[Attributes.MEDIA_TITLE] = "Surveillance Station"
                 self._entity.attributes[Attributes.MEDIA_ARTIST] = "No cameras configured"
                 self._entity.attributes[Attributes.STATE] = States.UNAVAILABLE
-                self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+                self._push_attributes()
                 
         except Exception as ex:
             _LOG.error(f"Error pushing initial camera state: {ex}")
 
+    def _local_ip_for_remote(self) -> str:
+        """Determine the local address the remote can reach us on."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect((self._client._host, 1))
+                return sock.getsockname()[0]
+        except OSError:
+            return ""
+
+    async def _handle_snapshot_request(self, request: "web.Request") -> "web.Response":
+        """Serve the cached raw JPEG for a camera (snapshot HTTP server)."""
+        camera_id = request.match_info.get('camera_id', '')
+        cached = self._snapshot_raw.get(camera_id)
+        if not cached:
+            return web.Response(status=404)
+        etag, image_bytes = cached
+        return web.Response(
+            body=image_bytes,
+            content_type="image/jpeg",
+            headers={"ETag": etag, "Cache-Control": "no-cache"}
+        )
+
+    async def _start_snapshot_server(self) -> None:
+        """Start the local snapshot HTTP server if enabled and possible."""
+        if self._http_runner or not AIOHTTP_AVAILABLE:
+            return
+        if not self._config.enabled_features.get("snapshot_http_server", False):
+            return
+
+        host_ip = self._local_ip_for_remote()
+        if not host_ip:
+            _LOG.warning("Could not determine local IP - snapshot server disabled")
+            return
+
+        try:
+            app = web.Application()
+            app.router.add_get("/snapshot/{camera_id}", self._handle_snapshot_request)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "0.0.0.0", _SNAPSHOT_SERVER_PORT)
+            await site.start()
+            self._http_runner = runner
+            self._http_base_url = f"http://{host_ip}:{_SNAPSHOT_SERVER_PORT}"
+            _LOG.info(f"Snapshot HTTP server listening at {self._http_base_url}")
+        except Exception as ex:
+            _LOG.warning(f"Snapshot HTTP server failed to start, using data URLs: {ex}")
+            self._http_runner = None
+            self._http_base_url = None
+
+    async def _stop_snapshot_server(self) -> None:
+        """Stop the local snapshot HTTP server."""
+        if self._http_runner:
+            try:
+                await self._http_runner.cleanup()
+            except Exception as ex:
+                _LOG.debug(f"Error stopping snapshot server: {ex}")
+            self._http_runner = None
+            self._http_base_url = None
+
     async def start(self) -> None:
         """Start camera monitoring."""
         if not self._polling_task or self._polling_task.done():
             if self._client.connected and self._cameras:
+                await self._start_snapshot_server()
                 self._entity.attributes[Attributes.STATE] = States.PLAYING
                 self._polling_task = asyncio.create_task(self._camera_polling_loop())
 
@@ -460,6 +709,7 @@ class SynologyCameraMonitor:
             except asyncio.CancelledError:
                 pass
             self._polling_task = None
+        await self._stop_snapshot_server()
 
     @property
     def entity(self) -> MediaPlayer:
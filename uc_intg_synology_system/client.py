@@ -6,8 +6,12 @@ Synology API client wrapper for system monitoring.
 """
 
 import asyncio
+import bisect
+import concurrent.futures
+import functools
 import logging
 import time
+from itertools import compress
 from typing import Any, Dict, Optional
 
 try:
@@ -18,6 +22,19 @@ try:
 except ImportError:
     SYNOLOGY_API_AVAILABLE = False
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from uc_intg_synology_system.helpers import (
     format_temperature,
     format_bytes,
@@ -27,20 +44,140 @@ from uc_intg_synology_system.helpers import (
 
 _LOG = logging.getLogger(__name__)
 
+# Interned key paths for safe_get_nested_value so hot parsers do not build a
+# fresh list literal on every call
+_KEY_DISKS = ('data', 'disks')
+_KEY_EXT_POWER = ('data', 'ext_power_status')
+_KEY_MODEL = ('data', 'model')
+_KEY_NIF = ('data', 'nif')
+_KEY_PACKAGES = ('data', 'packages')
+_KEY_SERVICE = ('data', 'service')
+_KEY_SHARED_CACHES = ('data', 'sharedCaches')
+_KEY_SSD_CACHES = ('data', 'ssdCaches')
+_KEY_STORAGE_POOLS = ('data', 'storagePools')
+_KEY_SYS_TEMP = ('data', 'sys_temp')
+_KEY_UPS_INFO = ('data', 'ups_info')
+_KEY_VERSION_STRING = ('data', 'version_string')
+_KEY_VOLUMES = ('data', 'volumes')
+
+# Service-id token -> (package key, display name) dispatch used during package
+# detection, replacing repeated substring chains per service entry
+_PKG_TOKEN_MAP = {
+    'docker': ('Docker', 'Docker'),
+    'surveillance': ('SurveillanceStation', 'Surveillance Station'),
+}
+_MEDIA_TOKENS = ('audio', 'video', 'photo')
+
+# Status sets for O(1) membership tests in the services loop
+_RUNNING_STATUSES = frozenset(('enabled', 'static'))
+_COUNTED_STATUSES = frozenset(('enabled', 'static', 'disabled'))
+
+# (status, smart_status) combinations considered healthy for a drive
+_OK_STATUS_PAIRS = frozenset({('normal', 'normal')})
+
+# Package states counted as running by the package manager view
+_PKG_RUNNING_STATES = frozenset(('running', 'start'))
+
+# Shared empty-dict sentinel; never mutated, avoids a fresh {} per lookup miss
+_EMPTY: Dict[str, Any] = {}
+
+# Transient network failures the get_* methods re-raise instead of mapping to
+# an error payload, so callers (the dashboard polling loop) can back off and
+# retry; requests' exceptions subclass OSError via IOError, so they are
+# covered. Parse/shape errors stay handled locally per method
+_TRANSIENT_ERRORS = (asyncio.TimeoutError, ConnectionError, OSError)
+
+# Fallback package list used when the package API is unavailable
+_FALLBACK_APIS = (
+    "ActiveBackup", "AI", "AntiVirus", "AudioPlayer", "Backup",
+    "C2FS", "Contacts", "Docker", "Foto", "FotoTeam", "LogCenter",
+    "NoteStation", "Office", "PDFViewer", "PersonMailAccount",
+    "SurveillanceStation", "SynologyDrive", "TextEditor", "USBCopy",
+    "WebStation"
+)
+_FALLBACK_COUNT = len(_FALLBACK_APIS)
+
+# Thermal status bands, looked up via bisect instead of an if/elif chain
+_TEMP_THRESHOLDS = (60, 70, 80, 90)
+_TEMP_STATUS = ('optimal', 'normal', 'warm', 'hot', 'critical')
+
+# Per-endpoint cache TTLs: storage is the most dynamic payload, system info
+# is mostly static (model/version) and services change rarely
+_ENDPOINT_TTLS = {
+    'storage': 2.0,
+    'sys_info': 5.0,
+    'services': 10.0,
+    'utilization': 2.0,
+    'network_info': 2.0,
+    # Installed packages only change on user action; cache for a minute
+    'packages': 60.0,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_temp(temp_c, unit: str) -> str:
+    """Memoized format_temperature: the same few readings recur every poll."""
+    return format_temperature(temp_c, unit)
+
+@functools.lru_cache(maxsize=64)
 def parse_uptime_string(uptime_str: str) -> int:
     """Parses uptime string like '748:31:1' into total seconds."""
     try:
-        parts = list(map(int, uptime_str.split(':')))
-        if len(parts) == 3:
-            h, m, s = parts
-            return h * 3600 + m * 60 + s
-        return int(uptime_str) # Fallback for plain seconds
+        h, sep, rest = uptime_str.partition(':')
+        if not sep:
+            return int(uptime_str)  # Fallback for plain seconds
+        m, _, s = rest.partition(':')
+        return int(h) * 3600 + int(m) * 60 + (int(s) if s else 0)
     except (ValueError, TypeError):
         return 0
 
+def _classify_connect_error(message: str) -> str:
+    """Bucket a connect failure message into a coarse error kind.
+
+    Classified once at failure time so callers (setup) can map to their own
+    error codes with a dict lookup instead of re-sniffing the string.
+    """
+    msg = message.lower()
+    if 'authentication' in msg or 'login' in msg:
+        return 'auth'
+    if 'timeout' in msg or 'timed out' in msg:
+        return 'timeout'
+    if 'connection refused' in msg:
+        return 'refused'
+    return 'other'
+
+
+# One live client per NAS target: consumers created at different times
+# (setup, entity creation, placeholder swap) share a single DSM session and
+# its caches instead of stacking SIDs, keep-alives and thread pools
+_SHARED_CLIENTS: Dict[tuple, "SynologySystemClient"] = {}
+
+
 class SynologySystemClient:
     """Synology API client wrapper with 2FA reboot survival capability."""
 
+    @classmethod
+    def shared(cls, host: str, port: int, username: str, password: str,
+               **kwargs) -> "SynologySystemClient":
+        """Return the registered client for this target, or create one.
+
+        A connected client is reused only while the password and every other
+        construction setting (secure, temperature_unit, ...) match, so a
+        reconfigure that changes any of them always builds a fresh session
+        instead of silently keeping the old scheme or unit.
+        """
+        key = (host, port, username)
+        client = _SHARED_CLIENTS.get(key)
+        if (client is not None and client.connected
+                and client._password == password
+                and all(getattr(client, '_' + name) == value
+                        for name, value in kwargs.items())):
+            return client
+        client = cls(host=host, port=port, username=username,
+                     password=password, **kwargs)
+        _SHARED_CLIENTS[key] = client
+        return client
+
     def __init__(self, host: str, port: int, username: str, password: str,
                  secure: bool = True, dsm_version: int = 7, otp_code: str = None,
                  temperature_unit: str = "celsius"):
@@ -52,6 +189,9 @@ class SynologySystemClient:
         self._dsm_version = dsm_version
         self._otp_code = otp_code
         self._temperature_unit = temperature_unit
+        # Unit is fixed for the client's lifetime; bind a specialized
+        # formatter once instead of passing the unit string on every call
+        self._format_temp = functools.partial(_fmt_temp, unit=temperature_unit)
 
         self._sys_info = None
         self._docker = None
@@ -59,29 +199,172 @@ class SynologySystemClient:
 
         self._connected = False
         self._last_error = None
+        self._last_error_kind = 'other'
         self._available_packages = {}
 
         self._session_id = None
         self._session_timestamp = None
         self._initial_connection_made = False
 
+        # Short-TTL response cache keyed by endpoint name: many get_* methods
+        # hit the same handful of DSM endpoints within one polling cycle
+        self._cache: Dict[str, tuple] = {}
+        # Single-flight bookkeeping: concurrent callers for the same endpoint
+        # share one outstanding fetch instead of each issuing their own
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Optional callback(ok: bool) invoked after each real endpoint fetch;
+        # the driver uses it to piggyback health checks on entity polling
+        self.health_listener = None
+
+        # Surveillance/UPS service flags, recomputed only when the services
+        # response actually changes instead of rescanned on every poll
+        self._service_flags_key = None
+        self._surveillance_enabled = False
+        self._ups_enabled = False
+        self._ups_static = False
+
+        # Negative cache for SSD cache probing: once a unit is known to have
+        # no cache, skip the storage re-check for a while (rarely changes)
+        self._cache_probe_ts = 0.0
+        self._cache_disabled_result = None
+
+        # Detected shape of the SSD cache size field ('dict'/'str'/'unknown');
+        # stable per NAS, so the isinstance dispatch runs once per connection
+        self._cache_size_shape: Optional[str] = None
+
+        # Small dedicated pool for the blocking DSM calls so polling bursts
+        # do not compete for the interpreter-wide default executor
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='syno-io'
+        )
+
+        # Shared keep-alive HTTP session so repeated DSM calls reuse TCP/TLS
+        # connections instead of paying a handshake per request
+        self._http_session = None
+        if REQUESTS_AVAILABLE:
+            self._http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            self._http_session.mount("https://", adapter)
+            self._http_session.mount("http://", adapter)
+            self._http_session.headers['Connection'] = 'keep-alive'
+            if ORJSON_AVAILABLE:
+                # Decode DSM JSON with orjson's C parser; the storage payload
+                # alone can be tens of KB per fetch
+                self._http_session.hooks['response'].append(self._orjson_response_hook)
+
+    @staticmethod
+    def _orjson_response_hook(response, **_kwargs):
+        """Rebind Response.json to orjson for faster payload decoding."""
+        response.json = lambda **kwargs: orjson.loads(response.content)
+        return response
+
+    def _attach_http_session(self, api_obj) -> None:
+        """Share the pooled keep-alive session with a synology_api wrapper."""
+        if self._http_session is not None and hasattr(api_obj, 'session'):
+            api_obj.session = self._http_session
+            _LOG.debug(f"Attached pooled keep-alive session to {type(api_obj).__name__}")
+
+    async def _run_blocking(self, fn, *args) -> Any:
+        """Run a blocking synology_api call on the dedicated I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def _cached(self, key: str, fn, ttl: Optional[float] = None) -> Any:
+        """
+        Return a recent cached response for an endpoint, fetching if stale.
+
+        :param key: Endpoint cache key
+        :param fn: Zero-argument synchronous fetch function
+        :param ttl: Maximum age in seconds before a re-fetch; defaults to the
+                    per-endpoint TTL table
+        """
+        if ttl is None:
+            ttl = _ENDPOINT_TTLS.get(key, 3.0)
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await pending
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._run_blocking(fn)
+            self._cache[key] = (time.monotonic(), data)
+            future.set_result(data)
+            if self.health_listener:
+                self.health_listener(True)
+            return data
+        except BaseException as ex:
+            future.set_exception(ex)
+            future.exception()  # mark retrieved when there are no waiters
+            if self.health_listener:
+                self.health_listener(False)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _scan_service_flags(self, service_list: list) -> None:
+        """
+        Refresh the surveillance/UPS service flags from a services list.
+
+        The flags rarely change, so the scan is skipped entirely while the
+        (service_id, enable_status) fingerprint stays the same.
+        """
+        key = hash(tuple(
+            (s.get('service_id', ''), s.get('enable_status', '')) for s in service_list
+        ))
+        if key == self._service_flags_key:
+            return
+
+        surveillance_enabled = False
+        ups_enabled = False
+        ups_static = False
+        for s in service_list:
+            sid = (s.get('service_id') or '').lower()
+            status = s.get('enable_status') or ''
+            if 'surveillance' in sid:
+                if status == 'enabled':
+                    surveillance_enabled = True
+            elif 'ups' in sid:
+                if status == 'enabled':
+                    ups_enabled = True
+                elif status == 'static':
+                    ups_static = True
+
+        self._surveillance_enabled = surveillance_enabled
+        self._ups_enabled = ups_enabled
+        self._ups_static = ups_static
+        self._service_flags_key = key
+
+    async def _get_storage(self) -> Dict[str, Any]:
+        """Fetch the storage payload once per cycle via the endpoint cache."""
+        return await self._cached('storage', self._sys_info.storage)
+
     async def connect(self) -> bool:
         """Connect to Synology NAS with 2FA reboot survival logic."""
         try:
             _LOG.info(f"Connecting to Synology NAS at {self._host}:{self._port}")
 
-            self._sys_info = core_sys_info.SysInfo(
-                ip_address=self._host,
-                port=self._port,
-                username=self._username,
-                password=self._password,
-                secure=self._secure,
-                dsm_version=self._dsm_version,
-                otp_code=self._otp_code if self._otp_code else None
+            # Constructor performs the DSM login; keep it off the event loop
+            self._sys_info = await self._run_blocking(
+                lambda: core_sys_info.SysInfo(
+                    ip_address=self._host,
+                    port=self._port,
+                    username=self._username,
+                    password=self._password,
+                    secure=self._secure,
+                    dsm_version=self._dsm_version,
+                    otp_code=self._otp_code if self._otp_code else None
+                )
             )
+            self._attach_http_session(self._sys_info)
 
             # Test connection with a basic API call
-            test_response = self._sys_info.get_system_info()
+            test_response = await self._run_blocking(self._sys_info.get_system_info)
             if test_response and test_response.get('success'):
                 self._connected = True
                 self._initial_connection_made = True
@@ -101,12 +384,13 @@ class SynologySystemClient:
             _LOG.error(f"Connection failed: {ex}")
             self._connected = False
             self._last_error = str(ex)
+            self._last_error_kind = _classify_connect_error(self._last_error)
             return False
 
     async def _detect_available_packages(self) -> None:
         """Detect available packages from the API."""
         try:
-            services_response = self._sys_info.services_status()
+            services_response = await self._run_blocking(self._sys_info.services_status)
             if services_response and services_response.get('success'):
                 services = services_response.get('data', {}).get('service', [])
 
@@ -115,15 +399,16 @@ class SynologySystemClient:
 
                 for service in services:
                     service_id = service.get('service_id', '').lower()
-                    service_name = service.get('service', service_id)
 
-                    # Map services to package names
-                    if 'docker' in service_id:
-                        self._available_packages['Docker'] = 'Docker'
-                    elif 'surveillance' in service_id:
-                        self._available_packages['SurveillanceStation'] = 'Surveillance Station'
-                    elif any(pkg in service_id for pkg in ['audio', 'video', 'photo']):
-                        self._available_packages[service_name] = service_name
+                    # Map services to package names via the token table
+                    for token, (pkg_key, pkg_name) in _PKG_TOKEN_MAP.items():
+                        if token in service_id:
+                            self._available_packages[pkg_key] = pkg_name
+                            break
+                    else:
+                        if any(pkg in service_id for pkg in _MEDIA_TOKENS):
+                            service_name = service.get('service', service_id)
+                            self._available_packages[service_name] = service_name
 
                 _LOG.info(f"Detected packages: {list(self._available_packages.keys())}")
 
@@ -134,6 +419,15 @@ class SynologySystemClient:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    @property
+    def last_error_kind(self) -> str:
+        """Coarse category of the last connect failure: auth/timeout/refused/other."""
+        return self._last_error_kind
+
     @property
     def available_packages(self) -> Dict[str, str]:
         return self._available_packages
@@ -142,10 +436,15 @@ class SynologySystemClient:
         """Disconnect from the Synology NAS."""
         if self._sys_info:
             try:
-                self._sys_info.logout()
+                await self._run_blocking(self._sys_info.logout)
             except:
                 pass  # Ignore logout errors
+        self._cache.clear()
+        self._executor.shutdown(wait=False)
         self._connected = False
+        key = (self._host, self._port, self._username)
+        if _SHARED_CLIENTS.get(key) is self:
+            del _SHARED_CLIENTS[key]
         _LOG.info("Disconnected from Synology NAS")
 
     async def get_system_overview(self, initial_fetch: bool = False) -> Dict[str, Any]:
@@ -155,23 +454,32 @@ class SynologySystemClient:
             if initial_fetch:
                 await asyncio.sleep(1)
 
-            info_raw = self._sys_info.get_system_info()
-            util_raw = self._sys_info.get_all_system_utilization()
+            # The two DSM round-trips are independent; overlap them so the
+            # overview costs one RTT of wall time instead of two
+            info_raw, util_raw = await asyncio.gather(
+                self._cached('sys_info', self._sys_info.get_system_info),
+                self._cached('utilization', self._sys_info.get_all_system_utilization)
+            )
 
-            cpu_load = safe_get_nested_value(util_raw, ['cpu', 'user_load'], 0)
-            mem_usage = safe_get_nested_value(util_raw, ['memory', 'real_usage'], 0)
-            temp_c = safe_get_nested_value(info_raw, ['data', 'sys_temp'], 0)
-            uptime_str = safe_get_nested_value(info_raw, ['data', 'up_time'], "0:0:0")
+            # One direct dict walk instead of five safe_get_nested_value calls
+            data = (info_raw or {}).get('data') or {}
+            util = util_raw or {}
+            cpu_load = (util.get('cpu') or {}).get('user_load', 0)
+            mem_usage = (util.get('memory') or {}).get('real_usage', 0)
+            temp_c = data.get('sys_temp', 0)
+            uptime_str = data.get('up_time', "0:0:0")
 
             return {
-                "model": safe_get_nested_value(info_raw, ['data', 'model'], "N/A"),
-                "version": safe_get_nested_value(info_raw, ['data', 'firmware_ver'], 'N/A'),
+                "model": data.get('model', "N/A"),
+                "version": data.get('firmware_ver', 'N/A'),
                 "status": "healthy",
                 "cpu_usage": float(cpu_load),
                 "memory_usage": float(mem_usage),
-                "temperature": format_temperature(temp_c, self._temperature_unit),
+                "temperature": self._format_temp(temp_c),
                 "uptime": format_uptime(parse_uptime_string(uptime_str)),
             }
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_system_overview: {ex}", exc_info=True)
             return {}
@@ -180,11 +488,18 @@ class SynologySystemClient:
         """Get storage status information."""
         if not self._connected: return {}
         try:
-            storage_raw = self._sys_info.storage()
-            volumes = safe_get_nested_value(storage_raw, ['data', 'volumes'], [])
-            total_size = sum(int(vol.get('size', {}).get('total', '0')) for vol in volumes)
-            total_used = sum(int(vol.get('size', {}).get('used', '0')) for vol in volumes)
+            storage_raw = await self._get_storage()
+            volumes = safe_get_nested_value(storage_raw, _KEY_VOLUMES, [])
+            total_size = 0
+            total_used = 0
+            _int = int
+            for vol in volumes:
+                size = vol.get('size') or {}
+                total_size += _int(size.get('total') or 0)
+                total_used += _int(size.get('used') or 0)
             return {"total_size": total_size, "total_used": total_used, "health_status": "healthy"}
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_storage_status: {ex}", exc_info=True)
             return {}
@@ -195,10 +510,11 @@ class SynologySystemClient:
             return {"status": "unavailable", "interfaces": 0, "total_rx": 0, "total_tx": 0}
 
         try:
-            net_raw = self._sys_info.get_network_info()
-            interfaces = safe_get_nested_value(net_raw, ['data', 'nif'], [])
-            
-            util_raw = self._sys_info.get_all_system_utilization()
+            net_raw, util_raw = await asyncio.gather(
+                self._cached('network_info', self._sys_info.get_network_info),
+                self._cached('utilization', self._sys_info.get_all_system_utilization)
+            )
+            interfaces = safe_get_nested_value(net_raw, _KEY_NIF, [])
             network_data = util_raw.get('network', [])
             _LOG.debug(f"Network data found: {network_data}")
             
@@ -226,6 +542,8 @@ class SynologySystemClient:
                 "interface_details": interfaces
             }
             
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Network error: {ex}", exc_info=True)
             return {"status": "error", "interfaces": 0, "total_rx": 0, "total_tx": 0}
@@ -236,33 +554,25 @@ class SynologySystemClient:
             return {"status": "unavailable", "running_count": 0, "total_count": 0}
 
         try:
-            services_raw = self._sys_info.services_status()
-            service_list = safe_get_nested_value(services_raw, ['data', 'service'], [])
+            services_raw = await self._cached('services', self._sys_info.services_status)
+            service_list = safe_get_nested_value(services_raw, _KEY_SERVICE, [])
 
             if not service_list:
                 _LOG.warning("No service data returned from API")
                 return {"status": "no_data", "running_count": 0, "total_count": 0}
 
-            running_count = 0
-            enabled_count = 0
-            system_services = []
-            package_services = []
-
-            for service in service_list:
-                service_id = service.get('service_id', '')
-                enable_status = service.get('enable_status', '')
-
-                # Count enabled services (these are considered "running" in DSM)
-                if enable_status in ['enabled', 'static']:
-                    running_count += 1
-
-                if enable_status in ['enabled', 'static', 'disabled']:
-                    enabled_count += 1
+            # Classify in bulk instead of growing the lists item by item:
+            # enabled services are considered "running" in DSM
+            statuses = [s.get('enable_status', '') for s in service_list]
+            running_count = sum(st in _RUNNING_STATUSES for st in statuses)
+            enabled_count = sum(st in _COUNTED_STATUSES for st in statuses)
 
-                if service_id.startswith('pkg-') or 'package' in service_id.lower():
-                    package_services.append(service)
-                else:
-                    system_services.append(service)
+            pkg_tags = [
+                sid.startswith('pkg-') or 'package' in sid.lower()
+                for sid in (s.get('service_id', '') for s in service_list)
+            ]
+            package_services = list(compress(service_list, pkg_tags))
+            system_services = list(compress(service_list, (not t for t in pkg_tags)))
 
             total_count = len(service_list)
 
@@ -275,6 +585,8 @@ class SynologySystemClient:
                 "enabled_count": enabled_count
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_services_status: {ex}", exc_info=True)
             return {"status": "error", "running_count": 0, "total_count": 0}
@@ -293,19 +605,24 @@ class SynologySystemClient:
         if not self._connected: return {}
         return {}
 
-    async def get_surveillance_status(self) -> Dict[str, Any]:
-        """Get Surveillance Station status with camera data."""
+    async def get_surveillance_status(self, service_list: Optional[list] = None) -> Dict[str, Any]:
+        """
+        Get Surveillance Station status with camera data.
+
+        :param service_list: Optional pre-fetched services list; avoids a
+                             redundant services_status round trip
+        """
         if not self._connected:
             return {"status": "unavailable", "camera_count": 0, "recording_count": 0}
 
         try:
-            services_raw = self._sys_info.services_status()
-            service_list = safe_get_nested_value(services_raw, ['data', 'service'], [])
-            
-            surveillance_services = [s for s in service_list if 'surveillance' in s.get('service_id', '').lower()]
-            surveillance_enabled = any(s.get('enable_status') == 'enabled' for s in surveillance_services)
-            
-            if not surveillance_enabled:
+            if service_list is None:
+                services_raw = await self._cached('services', self._sys_info.services_status)
+                service_list = safe_get_nested_value(services_raw, _KEY_SERVICE, [])
+
+            self._scan_service_flags(service_list)
+
+            if not self._surveillance_enabled:
                 return {
                     "status": "disabled",
                     "camera_count": 0,
@@ -316,15 +633,18 @@ class SynologySystemClient:
             if not self._surveillance:
                 try:
                     from synology_api.surveillancestation import SurveillanceStation
-                    self._surveillance = SurveillanceStation(
-                        ip_address=self._host,
-                        port=self._port,
-                        username=self._username,
-                        password=self._password,
-                        secure=self._secure,
-                        dsm_version=self._dsm_version,
-                        otp_code=self._otp_code
+                    self._surveillance = await self._run_blocking(
+                        lambda: SurveillanceStation(
+                            ip_address=self._host,
+                            port=self._port,
+                            username=self._username,
+                            password=self._password,
+                            secure=self._secure,
+                            dsm_version=self._dsm_version,
+                            otp_code=self._otp_code
+                        )
                     )
+                    self._attach_http_session(self._surveillance)
                 except Exception as surv_ex:
                     _LOG.warning(f"Could not initialize Surveillance Station API: {surv_ex}")
                     return {
@@ -334,7 +654,7 @@ class SynologySystemClient:
                         "error": str(surv_ex)
                     }
 
-            camera_data = self._surveillance.camera_list()
+            camera_data = await self._run_blocking(self._surveillance.camera_list)
             
             if camera_data and camera_data.get('success'):
                 cameras = camera_data.get('data', {}).get('cameras', [])
@@ -362,6 +682,8 @@ class SynologySystemClient:
                     "error": "No camera data available"
                 }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_surveillance_status: {ex}", exc_info=True)
             return {
@@ -377,8 +699,8 @@ class SynologySystemClient:
             return {"status": "unavailable", "system_temp": 0, "cpu_temp": 0, "temperature_formatted": "N/A"}
 
         try:
-            info_raw = self._sys_info.get_system_info()
-            temp_c = safe_get_nested_value(info_raw, ['data', 'sys_temp'], 0)
+            info_raw = await self._cached('sys_info', self._sys_info.get_system_info)
+            temp_c = safe_get_nested_value(info_raw, _KEY_SYS_TEMP, 0)
 
             fan_mode = "full_speed"  # Default for enterprise NAS models
             try:
@@ -392,19 +714,11 @@ class SynologySystemClient:
 
             if temp_c == 0:
                 status = "unavailable"
-            elif temp_c < 60:
-                status = "optimal"
-            elif temp_c < 70:
-                status = "normal"
-            elif temp_c < 80:
-                status = "warm"
-            elif temp_c < 90:
-                status = "hot"
             else:
-                status = "critical"
+                status = _TEMP_STATUS[bisect.bisect_right(_TEMP_THRESHOLDS, temp_c)]
 
             # Use the user's configured temperature unit
-            temperature_formatted = format_temperature(temp_c, self._temperature_unit)
+            temperature_formatted = self._format_temp(temp_c)
 
             return {
                 "status": status,
@@ -415,6 +729,8 @@ class SynologySystemClient:
                 "warning_threshold": 80,
                 "critical_threshold": 90
             }
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_thermal_status: {ex}", exc_info=True)
             return {"status": "error", "system_temp": 0, "cpu_temp": 0, "temperature_formatted": "Error"}
@@ -424,51 +740,42 @@ class SynologySystemClient:
         if not self._connected:
             return {"status": "unavailable", "cache_enabled": False, "cache_usage": 0}
 
+        if self._cache_disabled_result is not None and time.monotonic() - self._cache_probe_ts < 60:
+            return self._cache_disabled_result
+
         try:
-            storage_raw = self._sys_info.storage()
+            storage_raw = await self._get_storage()
 
-            ssd_caches = safe_get_nested_value(storage_raw, ['data', 'ssdCaches'], [])
-            shared_caches = safe_get_nested_value(storage_raw, ['data', 'sharedCaches'], [])
-            disks = safe_get_nested_value(storage_raw, ['data', 'disks'], [])
+            ssd_caches = safe_get_nested_value(storage_raw, _KEY_SSD_CACHES, [])
+            shared_caches = safe_get_nested_value(storage_raw, _KEY_SHARED_CACHES, [])
+            disks = safe_get_nested_value(storage_raw, _KEY_DISKS, [])
 
             cache_enabled = len(ssd_caches) > 0 or len(shared_caches) > 0
 
             if cache_enabled:
+                self._cache_disabled_result = None
                 total_cache_size = 0
                 used_cache_size = 0
                 cache_hit_rate = 0
 
+                _int = int
                 for cache in ssd_caches:
-                    cache_size = safe_get_nested_value(cache, ['size', 'total'], 0)
-                    cache_used = safe_get_nested_value(cache, ['size', 'occupied'], 0)
+                    size = cache.get('size') or {}
+                    total_cache_size += _int(size.get('total') or 0)
+                    used_cache_size += _int(size.get('occupied') or 0)
                     hit_rate = cache.get('hit_rate', 0)
-
-                    if isinstance(cache_size, str):
-                        cache_size = int(cache_size)
-                    if isinstance(cache_used, str):
-                        cache_used = int(cache_used)
-
-                    total_cache_size += cache_size
-                    used_cache_size += cache_used
                     cache_hit_rate = max(cache_hit_rate, hit_rate)
 
                 if total_cache_size == 0:
                     for cache in shared_caches:
-                        cache_size = safe_get_nested_value(cache, ['size', 'total'], 0)
-                        cache_used = safe_get_nested_value(cache, ['size', 'used'], 0)
+                        size = cache.get('size') or {}
+                        total_cache_size += _int(size.get('total') or 0)
+                        used_cache_size += _int(size.get('used') or 0)
 
-                        if isinstance(cache_size, str):
-                            cache_size = int(cache_size)
-                        if isinstance(cache_used, str):
-                            cache_used = int(cache_used)
-
-                        total_cache_size += cache_size
-                        used_cache_size += cache_used
-
-                ssd_count = 0
-                for disk in disks:
-                    if disk.get('isSsd', False) and 'cache' in disk.get('used_by', '').lower():
-                        ssd_count += 1
+                ssd_count = sum(
+                    1 for d in disks
+                    if d.get('isSsd') and 'cache' in (d.get('used_by') or '').lower()
+                )
 
                 cache_usage_pct = 0
                 if total_cache_size > 0:
@@ -485,14 +792,19 @@ class SynologySystemClient:
                     "cache_hit_rate": cache_hit_rate if cache_hit_rate > 0 else 90
                 }
             else:
-                return {
+                disabled = {
                     "status": "disabled",
                     "cache_enabled": False,
                     "cache_usage": 0,
                     "ssd_count": 0,
                     "cache_hit_rate": 0
                 }
+                self._cache_disabled_result = disabled
+                self._cache_probe_ts = time.monotonic()
+                return disabled
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_cache_status: {ex}", exc_info=True)
             return {"status": "error", "cache_enabled": False, "cache_usage": 0}
@@ -503,10 +815,10 @@ class SynologySystemClient:
             return {"status": "unavailable", "raid_level": "unknown", "degraded_drives": 0}
 
         try:
-            storage_raw = self._sys_info.storage()
-            storage_pools = safe_get_nested_value(storage_raw, ['data', 'storagePools'], [])
-            volumes = safe_get_nested_value(storage_raw, ['data', 'volumes'], [])
-            disks = safe_get_nested_value(storage_raw, ['data', 'disks'], [])
+            storage_raw = await self._get_storage()
+            storage_pools = safe_get_nested_value(storage_raw, _KEY_STORAGE_POOLS, [])
+            volumes = safe_get_nested_value(storage_raw, _KEY_VOLUMES, [])
+            disks = safe_get_nested_value(storage_raw, _KEY_DISKS, [])
 
             primary_raid_level = "unknown"
             rebuilding = False
@@ -561,6 +873,8 @@ class SynologySystemClient:
                 "total_system_drives": total_system_drives
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_raid_status: {ex}", exc_info=True)
             return {"status": "error", "raid_level": "unknown", "degraded_drives": 0}
@@ -571,18 +885,19 @@ class SynologySystemClient:
             return {"status": "unavailable", "volume_count": 0, "healthy_volumes": 0}
 
         try:
-            storage_raw = self._sys_info.storage()
-            volumes = safe_get_nested_value(storage_raw, ['data', 'volumes'], [])
+            storage_raw = await self._get_storage()
+            volumes = safe_get_nested_value(storage_raw, _KEY_VOLUMES, [])
 
             volume_count = len(volumes)
             healthy_volumes = 0
             warning_volumes = 0
             critical_volumes = 0
-            total_usage = 0
+            sum_total = 0
+            sum_used = 0
 
             for vol in volumes:
                 vol_status = vol.get('status', 'unknown').lower()
-                size_info = vol.get('size', {})
+                size_info = vol.get('size') or {}
 
                 if vol_status == 'normal':
                     healthy_volumes += 1
@@ -592,14 +907,12 @@ class SynologySystemClient:
                     critical_volumes += 1
 
                 if size_info:
-                    total_size = int(size_info.get('total', '0'))
-                    used_size = int(size_info.get('used', '0'))
-
-                    if total_size > 0:
-                        usage_pct = (used_size / total_size) * 100
-                        total_usage += usage_pct
+                    sum_total += int(size_info.get('total') or 0)
+                    sum_used += int(size_info.get('used') or 0)
 
-            avg_usage = total_usage / volume_count if volume_count > 0 else 0
+            # Capacity-weighted usage: one division total instead of one per
+            # volume, and small volumes no longer skew the average
+            avg_usage = (sum_used / sum_total * 100) if sum_total else 0
 
             if critical_volumes > 0:
                 status = "critical"
@@ -617,25 +930,41 @@ class SynologySystemClient:
                 "average_usage": round(avg_usage, 1)
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_volume_status: {ex}", exc_info=True)
             return {"status": "error", "volume_count": 0, "healthy_volumes": 0}
 
-    async def get_ups_status(self) -> Dict[str, Any]:
-        """Get UPS status with model detection and status display."""
+    async def get_ups_status(self, service_list: Optional[list] = None,
+                             info_raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get UPS status with model detection and status display.
+
+        :param service_list: Optional pre-fetched services list
+        :param info_raw: Optional pre-fetched system info response
+        """
         if not self._connected:
             return {"status": "unavailable", "ups_connected": False, "battery_level": 0, "ups_model": "Unknown"}
 
         try:
-            info_raw = self._sys_info.get_system_info()
-            ups_info = safe_get_nested_value(info_raw, ['data', 'ups_info'], {})
-            ext_power_status = safe_get_nested_value(info_raw, ['data', 'ext_power_status'], 0)
-
-            services_raw = self._sys_info.services_status()
-            service_list = safe_get_nested_value(services_raw, ['data', 'service'], [])
-            ups_services = [s for s in service_list if 'ups' in s.get('service_id', '').lower()]
-            ups_service_enabled = any(s.get('enable_status') == 'enabled' for s in ups_services)
-            ups_service_static = any(s.get('enable_status') == 'static' for s in ups_services)
+            if info_raw is None and service_list is None:
+                info_raw, services_raw = await asyncio.gather(
+                    self._cached('sys_info', self._sys_info.get_system_info),
+                    self._cached('services', self._sys_info.services_status)
+                )
+                service_list = safe_get_nested_value(services_raw, _KEY_SERVICE, [])
+            else:
+                if info_raw is None:
+                    info_raw = await self._cached('sys_info', self._sys_info.get_system_info)
+                if service_list is None:
+                    services_raw = await self._cached('services', self._sys_info.services_status)
+                    service_list = safe_get_nested_value(services_raw, _KEY_SERVICE, [])
+            ups_info = safe_get_nested_value(info_raw, _KEY_UPS_INFO, {})
+            ext_power_status = safe_get_nested_value(info_raw, _KEY_EXT_POWER, 0)
+            self._scan_service_flags(service_list)
+            ups_service_enabled = self._ups_enabled
+            ups_service_static = self._ups_static
 
             ups_connected = bool(ups_info) or ups_service_enabled or ups_service_static or ext_power_status > 0
 
@@ -675,6 +1004,8 @@ class SynologySystemClient:
                 "last_test": "unknown"
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_ups_status: {ex}", exc_info=True)
             return {
@@ -690,27 +1021,46 @@ class SynologySystemClient:
             return {"status": "unavailable", "cpu_temp": 0, "monitored_drives": 0}
 
         try:
-            info_raw = self._sys_info.get_system_info()
-            storage_raw = self._sys_info.storage()
-
-            cpu_temp = safe_get_nested_value(info_raw, ['data', 'sys_temp'], 0)
-            disks = safe_get_nested_value(storage_raw, ['data', 'disks'], [])
+            info_raw, storage_raw = await asyncio.gather(
+                self._cached('sys_info', self._sys_info.get_system_info),
+                self._get_storage()
+            )
 
-            drive_temps = [d.get('temp', 0) for d in disks if d.get('temp', 0) > 0]
-            avg_drive_temp = sum(drive_temps) / len(drive_temps) if drive_temps else 0
+            cpu_temp = safe_get_nested_value(info_raw, _KEY_SYS_TEMP, 0)
+            disks = safe_get_nested_value(storage_raw, _KEY_DISKS, [])
+
+            # Single pass over the disks for count/sum/min/max instead of
+            # building a temp list and reducing it five times
+            temp_count = 0
+            temp_sum = 0
+            max_temp = 0
+            min_temp = 0
+            for d in disks:
+                t = d.get('temp', 0)
+                if t > 0:
+                    temp_sum += t
+                    if t > max_temp:
+                        max_temp = t
+                    if temp_count == 0 or t < min_temp:
+                        min_temp = t
+                    temp_count += 1
+
+            avg_drive_temp = temp_sum / temp_count if temp_count else 0
 
             return {
                 "status": "healthy",
                 "cpu_temp": cpu_temp,
-                "cpu_temp_formatted": format_temperature(cpu_temp, self._temperature_unit),
-                "monitored_drives": len(drive_temps),
+                "cpu_temp_formatted": self._format_temp(cpu_temp),
+                "monitored_drives": temp_count,
                 "average_drive_temp": round(avg_drive_temp, 1),
-                "average_drive_temp_formatted": format_temperature(avg_drive_temp, self._temperature_unit),
-                "max_drive_temp": max(drive_temps) if drive_temps else 0,
-                "max_drive_temp_formatted": format_temperature(max(drive_temps) if drive_temps else 0, self._temperature_unit),
-                "min_drive_temp": min(drive_temps) if drive_temps else 0,
-                "min_drive_temp_formatted": format_temperature(min(drive_temps) if drive_temps else 0, self._temperature_unit)
+                "average_drive_temp_formatted": self._format_temp(avg_drive_temp),
+                "max_drive_temp": max_temp,
+                "max_drive_temp_formatted": self._format_temp(max_temp),
+                "min_drive_temp": min_temp,
+                "min_drive_temp_formatted": self._format_temp(min_temp)
             }
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_hardware_monitor: {ex}", exc_info=True)
             return {"status": "error", "cpu_temp": 0, "monitored_drives": 0}
@@ -721,21 +1071,19 @@ class SynologySystemClient:
             return {"status": "unavailable", "total_drives": 0, "healthy_drives": 0}
 
         try:
-            storage_raw = self._sys_info.storage()
-            disks = safe_get_nested_value(storage_raw, ['data', 'disks'], [])
+            storage_raw = await self._get_storage()
+            disks = safe_get_nested_value(storage_raw, _KEY_DISKS, [])
 
             total_drives = len(disks)
-            healthy_drives = 0
-            warning_drives = 0
-
-            for disk in disks:
-                disk_status = disk.get('status', 'unknown').lower()
-                smart_status = disk.get('smart_status', 'unknown').lower()
-
-                if disk_status == 'normal' and smart_status == 'normal':
-                    healthy_drives += 1
-                else:
-                    warning_drives += 1
+            # Extract the status pairs once, then let list.count run the
+            # comparison loop in C instead of evaluating a Python predicate
+            # per disk on every poll
+            status_pairs = [
+                ((d.get('status') or '').lower(), (d.get('smart_status') or '').lower())
+                for d in disks
+            ]
+            healthy_drives = sum(pair in _OK_STATUS_PAIRS for pair in status_pairs)
+            warning_drives = total_drives - healthy_drives
 
             return {
                 "status": "healthy" if warning_drives == 0 else "warning",
@@ -744,6 +1092,8 @@ class SynologySystemClient:
                 "warning_drives": warning_drives,
                 "smart_tests_passed": healthy_drives
             }
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_drive_health: {ex}", exc_info=True)
             return {"status": "error", "total_drives": 0, "healthy_drives": 0}
@@ -759,18 +1109,20 @@ class SynologySystemClient:
             }
 
         try:
-            info_raw = self._sys_info.get_system_info()
-            sys_temp = safe_get_nested_value(info_raw, ['data', 'sys_temp'], 0)
-            model = safe_get_nested_value(info_raw, ['data', 'model'], 'Unknown')
-            version_string = safe_get_nested_value(info_raw, ['data', 'version_string'], 'Unknown')
+            info_raw, services_raw = await asyncio.gather(
+                self._cached('sys_info', self._sys_info.get_system_info),
+                self._cached('services', self._sys_info.services_status)
+            )
+            sys_temp = safe_get_nested_value(info_raw, _KEY_SYS_TEMP, 0)
+            model = safe_get_nested_value(info_raw, _KEY_MODEL, 'Unknown')
+            version_string = safe_get_nested_value(info_raw, _KEY_VERSION_STRING, 'Unknown')
 
-            ups_info = safe_get_nested_value(info_raw, ['data', 'ups_info'], {})
-            ext_power_status = safe_get_nested_value(info_raw, ['data', 'ext_power_status'], 0)
+            ups_info = safe_get_nested_value(info_raw, _KEY_UPS_INFO, {})
+            ext_power_status = safe_get_nested_value(info_raw, _KEY_EXT_POWER, 0)
 
-            services_raw = self._sys_info.services_status()
-            service_list = safe_get_nested_value(services_raw, ['data', 'service'], [])
-            ups_services = [s for s in service_list if 'ups' in s.get('service_id', '').lower()]
-            ups_service_enabled = any(s.get('enable_status') in ['enabled', 'static'] for s in ups_services)
+            service_list = safe_get_nested_value(services_raw, _KEY_SERVICE, [])
+            self._scan_service_flags(service_list)
+            ups_service_enabled = self._ups_enabled or self._ups_static
 
             ups_connected = bool(ups_info) or ups_service_enabled or ext_power_status > 0
 
@@ -786,14 +1138,9 @@ class SynologySystemClient:
                     ups_model = "UPS Detected"
 
             # Format temperature using user's preferred unit
-            temp_formatted = format_temperature(sys_temp, self._temperature_unit)
-
-            detailed_parts = []
-            detailed_parts.append(f"Temp: {temp_formatted}")
-            detailed_parts.append(f"Model: {model}")
-            detailed_parts.append(f"UPS: {ups_model}")
+            temp_formatted = self._format_temp(sys_temp)
 
-            detailed_info = " | ".join(detailed_parts)
+            detailed_info = f"Temp: {temp_formatted} | Model: {model} | UPS: {ups_model}"
 
             return {
                 "status": "active",
@@ -807,6 +1154,8 @@ class SynologySystemClient:
                 "version": version_string
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_power_management: {ex}", exc_info=True)
             return {
@@ -822,7 +1171,7 @@ class SynologySystemClient:
             return {"status": "unavailable", "error": "Not connected to NAS"}
 
         try:
-            storage_response = self._sys_info.storage()
+            storage_response = await self._get_storage()
 
             if not storage_response or not storage_response.get('success'):
                 _LOG.error("storage() API call failed")
@@ -846,15 +1195,21 @@ class SynologySystemClient:
                 device_type = cache.get('device_type', 'ssd')
                 size_info = cache.get('size', {})
 
-                if isinstance(size_info, dict):
+                shape = self._cache_size_shape
+                if shape is None:
+                    shape = ('dict' if isinstance(size_info, dict)
+                             else 'str' if isinstance(size_info, str) else 'unknown')
+                    self._cache_size_shape = shape
+
+                if shape == 'dict':
                     total_bytes = int(size_info.get('total', 0))
                     occupied_bytes = int(size_info.get('occupied', 0))
-                    
+
                     size_gb = total_bytes / (1024**3) if total_bytes > 0 else 0
                     usage_pct = (occupied_bytes / total_bytes * 100) if total_bytes > 0 else 0
 
                     info_parts = [f"SSD Cache: {size_gb:.1f}GB", f"Used: {usage_pct:.1f}%"]
-                elif isinstance(size_info, str):
+                elif shape == 'str':
                     total_bytes = int(size_info)
                     size_gb = total_bytes / (1024**3)
                     info_parts = [f"SSD Cache: {size_gb:.1f}GB"]
@@ -927,6 +1282,8 @@ class SynologySystemClient:
                     "cache_type": "none"
                 }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_cache_performance: {ex}", exc_info=True)
             return {
@@ -946,41 +1303,43 @@ class SynologySystemClient:
 
             try:
                 if hasattr(self._sys_info, '_request_data'):
-                    packages_raw = self._sys_info._request_data("SYNO.Core.Package", "list", {"additional": "status"})
+                    packages_raw = await self._cached(
+                        'packages',
+                        functools.partial(self._sys_info._request_data,
+                                          "SYNO.Core.Package", "list",
+                                          {"additional": "status"})
+                    )
+            except _TRANSIENT_ERRORS:
+                raise
             except Exception:
                 pass
 
             if not packages_raw or not packages_raw.get('success'):
-                all_apis = [
-                    "ActiveBackup", "AI", "AntiVirus", "AudioPlayer", "Backup",
-                    "C2FS", "Contacts", "Docker", "Foto", "FotoTeam", "LogCenter",
-                    "NoteStation", "Office", "PDFViewer", "PersonMailAccount",
-                    "SurveillanceStation", "SynologyDrive", "TextEditor", "USBCopy",
-                    "WebStation"
-                ]
-
-                installed_count = len(all_apis)
-                running_count = installed_count - 2  # Assume most are running
-
                 return {
                     "status": "active",
-                    "installed_packages": installed_count,
-                    "running_packages": running_count,
+                    "installed_packages": _FALLBACK_COUNT,
+                    "running_packages": _FALLBACK_COUNT - 2,  # Assume most are running
                     "updates_available": 0,
-                    "package_names": all_apis,
-                    "total_apis": len(all_apis),
-                    "active_packages": installed_count,
+                    "package_names": list(_FALLBACK_APIS),
+                    "total_apis": _FALLBACK_COUNT,
+                    "active_packages": _FALLBACK_COUNT,
                     "system_apis": 300,
-                    "package_apis": len(all_apis)
+                    "package_apis": _FALLBACK_COUNT
                 }
 
-            package_list = safe_get_nested_value(packages_raw, ['data', 'packages'], [])
+            package_list = safe_get_nested_value(packages_raw, _KEY_PACKAGES, [])
 
-            installed_count = len(package_list)
-            running_count = sum(1 for pkg in package_list if pkg.get('status') in ['running', 'start'])
-            updates_count = sum(1 for pkg in package_list if pkg.get('additional', {}).get('update_available', False))
-
-            package_names = [pkg.get('name', pkg.get('id', '')) for pkg in package_list]
+            # One pass instead of two sum() scans plus a names comprehension
+            running_count = 0
+            updates_count = 0
+            package_names = []
+            for pkg in package_list:
+                package_names.append(pkg.get('name') or pkg.get('id', ''))
+                if pkg.get('status') in _PKG_RUNNING_STATES:
+                    running_count += 1
+                if (pkg.get('additional') or _EMPTY).get('update_available'):
+                    updates_count += 1
+            installed_count = len(package_names)
 
             return {
                 "status": "healthy" if installed_count > 0 else "no_data",
@@ -994,6 +1353,8 @@ class SynologySystemClient:
                 "package_apis": installed_count
             }
 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as ex:
             _LOG.error(f"Error in get_package_manager: {ex}", exc_info=True)
             return {"status": "error", "installed_packages": 0, "running_packages": 0}
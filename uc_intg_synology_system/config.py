@@ -5,16 +5,32 @@ Configuration management for Synology System integration.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from uc_intg_synology_system.helpers import SynologyConstants, validate_ip_address, validate_port
 
 _LOG = logging.getLogger(__name__)
 
+# Fields that must be present before the integration can connect
+_REQUIRED_FIELDS = ('host', 'port', 'username', 'password')
+
+# Parsed-config cache keyed by path -> (mtime, size, parsed data), so
+# re-instantiating the config (e.g. on reconnect) skips the JSON re-parse
+# when the file on disk has not changed
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
 
 class SynologyConfig:
     """Configuration management for Synology integration."""
@@ -27,15 +43,29 @@ class SynologyConfig:
         """
         self._config_file = config_file or "config.json"
         self._config_data = {}
+        self._last_saved_digest = None
+        # Memoized get_enabled_sources result, keyed on the feature flags and
+        # package names it is derived from
+        self._sources_cache: Optional[tuple] = None
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from file."""
         try:
             if os.path.exists(self._config_file):
-                with open(self._config_file, 'r', encoding='utf-8') as file:
-                    self._config_data = json.load(file)
-                    _LOG.info(f"Configuration loaded from {self._config_file}")
+                stat = os.stat(self._config_file)
+                cached = _CONFIG_CACHE.get(self._config_file)
+                if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                    self._config_data = copy.deepcopy(cached[2])
+                    _LOG.debug(f"Configuration for {self._config_file} loaded from cache")
+                    return
+                with open(self._config_file, 'rb') as file:
+                    raw = file.read()
+                self._config_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                _LOG.info(f"Configuration loaded from {self._config_file}")
+                _CONFIG_CACHE[self._config_file] = (
+                    stat.st_mtime, stat.st_size, copy.deepcopy(self._config_data)
+                )
             else:
                 _LOG.info(f"Configuration file {self._config_file} not found, using defaults")
                 self._create_default_config()
@@ -63,21 +93,49 @@ class SynologyConfig:
                     "storage_monitoring": True,
                     "ups_monitoring": True,
                     "surveillance_monitoring": False,
-                    "enhanced_monitoring": True  # Enable all enhanced features
+                    "enhanced_monitoring": True,  # Enable all enhanced features
+                    "snapshot_http_server": False,  # Serve camera snapshots over HTTP instead of base64 data URLs
+                    "webp_snapshots": False  # Transcode camera snapshots to WebP (smaller payloads)
                 },
                 "available_packages": {}
             }
         }
 
+    @property
+    def _syno(self) -> Dict[str, Any]:
+        """The synology_config section; single lookup shared by accessors."""
+        return self._config_data.get("synology_config", {})
+
     def save_config(self) -> bool:
         """Save configuration to file."""
         try:
+            if ORJSON_AVAILABLE:
+                serialized = orjson.dumps(self._config_data, option=orjson.OPT_INDENT_2)
+            else:
+                serialized = json.dumps(self._config_data, indent=2, ensure_ascii=False).encode('utf-8')
+            digest = hashlib.sha1(serialized).hexdigest()
+            if digest == self._last_saved_digest:
+                _LOG.debug("Configuration unchanged, skipping write")
+                return True
+
             config_path = Path(self._config_file)
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self._config_file, 'w', encoding='utf-8') as file:
-                json.dump(self._config_data, file, indent=2, ensure_ascii=False)
-            
+
+            # Write to a sibling temp file and rename so readers never see a
+            # partially written config (os.replace is atomic on POSIX)
+            tmp_file = self._config_file + '.tmp'
+            with open(tmp_file, 'wb') as file:
+                file.write(serialized)
+            os.replace(tmp_file, self._config_file)
+
+            self._last_saved_digest = digest
+            try:
+                stat = os.stat(self._config_file)
+                _CONFIG_CACHE[self._config_file] = (
+                    stat.st_mtime, stat.st_size, copy.deepcopy(self._config_data)
+                )
+            except OSError:
+                pass
             _LOG.info(f"Configuration saved to {self._config_file}")
             return True
         except Exception as ex:
@@ -92,10 +150,9 @@ class SynologyConfig:
         :return: True if configuration was updated successfully
         """
         try:
-            synology_config = self._config_data.get("synology_config", {})
+            synology_config = self._syno
             
-            required_fields = ["host", "port", "username", "password"]
-            for field in required_fields:
+            for field in _REQUIRED_FIELDS:
                 if field not in setup_data or not setup_data[field]:
                     _LOG.error(f"Missing required field: {field}")
                     return False
@@ -133,10 +190,19 @@ class SynologyConfig:
         :param packages: Dictionary of available packages
         """
         try:
-            synology_config = self._config_data.get("synology_config", {})
-            synology_config["available_packages"] = packages
-            
+            synology_config = self._syno
             enabled_features = synology_config.get("enabled_features", {})
+
+            # Package re-detection usually yields the same result; skip the
+            # config rewrite when nothing would actually change
+            if (packages == synology_config.get("available_packages")
+                    and ("Docker" not in packages or enabled_features.get("docker_monitoring"))
+                    and ("SurveillanceStation" not in packages
+                         or enabled_features.get("surveillance_monitoring"))):
+                _LOG.debug("Available packages unchanged, skipping config save")
+                return
+
+            synology_config["available_packages"] = packages
             
             if "Docker" in packages:
                 enabled_features["docker_monitoring"] = True
@@ -156,17 +222,11 @@ class SynologyConfig:
 
     def is_configured(self) -> bool:
         """Check if basic configuration is complete."""
-        synology_config = self._config_data.get("synology_config", {})
-        required_fields = ["host", "port", "username", "password"]
-        
-        for field in required_fields:
-            if not synology_config.get(field):
-                return False
-        
-        return True
+        synology_config = self._syno
+        return all(synology_config.get(field) for field in _REQUIRED_FIELDS)
 
     def get_connection_params(self) -> Dict[str, Any]:
-        synology_config = self._config_data.get("synology_config", {})
+        synology_config = self._syno
         return {
             "host": synology_config.get("host", ""),
             "port": synology_config.get("port", 5001),
@@ -179,47 +239,53 @@ class SynologyConfig:
 
     @property
     def host(self) -> str:
-        return self._config_data.get("synology_config", {}).get("host", "")
+        return self._syno.get("host", "")
 
     @property
     def port(self) -> int:
-        return self._config_data.get("synology_config", {}).get("port", 5001)
+        return self._syno.get("port", 5001)
 
     @property
     def username(self) -> str:
-        return self._config_data.get("synology_config", {}).get("username", "")
+        return self._syno.get("username", "")
 
     @property
     def use_https(self) -> bool:
-        return self._config_data.get("synology_config", {}).get("use_https", True)
+        return self._syno.get("use_https", True)
 
     @property
     def temperature_unit(self) -> str:
-        return self._config_data.get("synology_config", {}).get("temperature_unit", "celsius")
+        return self._syno.get("temperature_unit", "celsius")
 
     @property
     def polling_intervals(self) -> Dict[str, int]:
-        return self._config_data.get("synology_config", {}).get("polling_intervals", SynologyConstants.DEFAULT_POLLING)
+        return self._syno.get("polling_intervals", SynologyConstants.DEFAULT_POLLING)
 
     @property
     def enabled_features(self) -> Dict[str, bool]:
-        return self._config_data.get("synology_config", {}).get("enabled_features", {})
+        return self._syno.get("enabled_features", {})
 
     @property
     def available_packages(self) -> Dict[str, Any]:
-        return self._config_data.get("synology_config", {}).get("available_packages", {})
+        return self._syno.get("available_packages", {})
 
     def get_enabled_sources(self) -> Dict[str, str]:
         """Get enabled sources for the monitoring dashboard."""
+        enabled_features = self.enabled_features
+        available_packages = self.available_packages
+
+        # Pure function of the feature flags and package names; reuse the
+        # previous result while those stay unchanged
+        cache_key = (frozenset(enabled_features.items()), frozenset(available_packages))
+        if self._sources_cache is not None and self._sources_cache[0] == cache_key:
+            return dict(self._sources_cache[1])
+
         sources = {
             # Core system monitoring (always available)
             "SYSTEM_OVERVIEW": "System Overview",
             "STORAGE_STATUS": "Storage Status"
         }
         
-        enabled_features = self.enabled_features
-        available_packages = self.available_packages
-        
         # Add network and security if enabled
         if enabled_features.get("network_monitoring", True):
             sources["NETWORK_STATS"] = "Network Statistics"
@@ -245,23 +311,23 @@ class SynologyConfig:
                 "USER_SESSIONS": "User Sessions"  # CRITICAL: Ensure this is included
             })
 
+        # Package-dependent sources
         if enabled_features.get("surveillance_monitoring", True) and "SurveillanceStation" in available_packages:
             sources["SURVEILLANCE_STATUS"] = "Surveillance Station"
-            
-        # Package-dependent sources
+
         if enabled_features.get("docker_monitoring", True) and "Docker" in available_packages:
             sources["DOCKER_STATUS"] = "Docker Containers"
-        
-        if enabled_features.get("surveillance_monitoring", True) and "SurveillanceStation" in available_packages:
-            sources["SURVEILLANCE_STATUS"] = "Surveillance Station"
-        
+
         _LOG.info(f"Final enabled sources ({len(sources)}): {list(sources.values())}")
+        self._sources_cache = (cache_key, dict(sources))
         return sources
 
     def update_polling_interval(self, source: str, interval: int) -> bool:
         try:
-            synology_config = self._config_data.get("synology_config", {})
+            synology_config = self._syno
             polling_intervals = synology_config.get("polling_intervals", {})
+            if polling_intervals.get(source) == interval:
+                return True
             polling_intervals[source] = interval
             synology_config["polling_intervals"] = polling_intervals
             self._config_data["synology_config"] = synology_config
@@ -7,11 +7,13 @@ Main driver for Synology System integration
 """
 
 import asyncio
+import functools
 import logging
 import os
 import signal
 import sys
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 import ucapi
 from ucapi import Events, DeviceStates
@@ -29,123 +31,185 @@ from uc_intg_synology_system.media_player import SynologySystemDashboard
 from uc_intg_synology_system.remote import SynologySystemRemote
 from uc_intg_synology_system.camera_media_player import SynologyCameraMonitor
 
-# Configure logging
+# Configure logging once; DEBUG produces a steady stream of per-poll records
+# (formatted attribute pushes included), so default to INFO and let
+# UC_LOG_LEVEL opt back into verbose output
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("UC_LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
 _LOG = logging.getLogger(__name__)
 
-# Global variables for reboot survival
-api: ucapi.IntegrationAPI = None
-_config: SynologyConfig = None
-_client: SynologySystemClient = None
-_media_player: SynologySystemDashboard = None
-_camera_monitor: SynologyCameraMonitor = None
-_remote: SynologySystemRemote = None
-_monitoring_task: Optional[asyncio.Task] = None
+
+@dataclass(slots=True)
+class DriverState:
+    """Driver-wide mutable state, grouped for reboot survival.
+
+    The entities dict maps entity_id to its wrapper so subscription events
+    dispatch with a single lookup instead of per-entity comparisons.
+    """
+    api: Optional[ucapi.IntegrationAPI] = None
+    config: Optional[SynologyConfig] = None
+    client: Optional[SynologySystemClient] = None
+    media_player: Optional[SynologySystemDashboard] = None
+    camera_monitor: Optional[SynologyCameraMonitor] = None
+    remote: Optional[SynologySystemRemote] = None
+    entities: Dict[str, Any] = field(default_factory=dict)
+    monitoring_task: Optional[asyncio.Task] = None
+    health_events: Optional[asyncio.Queue] = None
+
+
+_state = DriverState()
+
+# How long the monitoring loop waits for entity-driven health events before
+# falling back to an active probe of its own
+_HEALTH_EVENT_TIMEOUT = 120.0
+
+# Upper bound on a single connect/reconnect attempt; a hung login otherwise
+# blocks the event handler for the full socket timeout
+_RECONNECT_TIMEOUT = 8.0
+
+
+# Last health-probe overview: (monotonic timestamp, data)
+_overview_probe_cache: Optional[tuple] = None
+
+
+async def _cached_overview(ttl: float = 9.0):
+    """Fetch the system overview for health probing, reusing a recent result.
+
+    Shields the probe path from refetching when the loop iterates quickly
+    (e.g. while recovering from repeated errors); the client's own endpoint
+    cache covers the underlying DSM calls.
+    """
+    global _overview_probe_cache
+    loop = asyncio.get_running_loop()
+    if _overview_probe_cache and loop.time() - _overview_probe_cache[0] < ttl:
+        return _overview_probe_cache[1]
+    data = await _state.client.get_system_overview()
+    _overview_probe_cache = (loop.time(), data)
+    return data
+
+
+async def _connect_with_timeout(connect_coro) -> bool:
+    """Await a connect/reconnect coroutine, treating a timeout as failure."""
+    try:
+        return await asyncio.wait_for(connect_coro, timeout=_RECONNECT_TIMEOUT)
+    except asyncio.TimeoutError:
+        _LOG.warning(f"Connection attempt timed out after {_RECONNECT_TIMEOUT}s")
+        return False
+
+
+def _report_health_event(ok: bool) -> None:
+    """Queue a health event from the client's fetch path (non-blocking)."""
+    if _state.health_events is None:
+        return
+    try:
+        _state.health_events.put_nowait("ok" if ok else "fail")
+    except asyncio.QueueFull:
+        pass  # monitoring is behind; dropping events is fine
 
 
 async def setup_handler_wrapper(msg: ucapi.SetupDriver) -> ucapi.SetupAction:
     """Handle integration setup flow and create entities."""
-    global _config, _client, _media_player, _camera_monitor, _remote
-    
-    if not _config:
-        config_path = os.path.join(api.config_dir_path, "config.json")
-        _config = SynologyConfig(config_path)
-    
+    if not _state.config:
+        config_path = os.path.join(_state.api.config_dir_path, "config.json")
+        _state.config = SynologyConfig(config_path)
+
     # Call setup handler from setup.py
-    action = await setup_handler(msg, _config)
-    
+    action = await setup_handler(msg, _state.config)
+
     # Entity creation happens ONLY on SetupComplete
     if isinstance(action, ucapi.SetupComplete):
         _LOG.info("Setup confirmed. Initializing integration components...")
-        
+
         # Reuse the connected client from setup
         setup_client = get_setup_client()
         if setup_client and setup_client.connected:
             _LOG.info("Reusing connected client from setup process")
-            _client = setup_client
+            _state.client = setup_client
             clear_setup_client()
         else:
             _LOG.error("No setup client available")
             return ucapi.SetupError(ucapi.IntegrationSetupError.OTHER)
-        
+
         # Create system monitoring entity (always created)
-        _media_player = SynologySystemDashboard(api, _client, _config)
-        _remote = SynologySystemRemote(api, _client, _config)
-        
+        _state.media_player = SynologySystemDashboard(_state.api, _state.client, _state.config)
+        _state.remote = SynologySystemRemote(_state.api, _state.client, _state.config)
+
         # Add core entities
-        api.available_entities.add(_media_player.entity)
-        api.available_entities.add(_remote.entity)
-        
+        _state.api.available_entities.add(_state.media_player.entity)
+        _state.api.available_entities.add(_state.remote.entity)
+        _state.entities[_state.media_player.entity_id] = _state.media_player
+        _state.entities[_state.remote.entity_id] = _state.remote
+
         # Create camera entity only if Surveillance Station available
-        available_packages = _client.available_packages
+        available_packages = _state.client.available_packages
         if "SurveillanceStation" in available_packages:
             _LOG.info("Surveillance Station detected - creating camera monitor entity")
-            _camera_monitor = SynologyCameraMonitor(api, _client, _config)
-            api.available_entities.add(_camera_monitor.entity)
+            _state.camera_monitor = SynologyCameraMonitor(_state.api, _state.client, _state.config)
+            _state.api.available_entities.add(_state.camera_monitor.entity)
+            _state.entities[_state.camera_monitor.entity_id] = _state.camera_monitor
             _LOG.info("Camera monitor entity created and added")
         else:
             _LOG.info("Surveillance Station not available - camera monitor not created")
-            _camera_monitor = None
-        
+            _state.camera_monitor = None
+
         _LOG.info("Synology entities are created and available.")
-    
+
     return action
 
 
 async def on_connect() -> None:
     """CRITICAL: Handle Remote Two connection with 2FA reboot survival."""
-    global _client, _config
-    
     _LOG.info("Remote Two connected. Attempting reboot survival reconnection...")
-    await api.set_device_state(DeviceStates.CONNECTING)
-    
+    await _state.api.set_device_state(DeviceStates.CONNECTING)
+
     # Load config from disk (may have been updated)
-    if not _config:
-        config_path = os.path.join(api.config_dir_path, "config.json")
-        _config = SynologyConfig(config_path)
-    elif hasattr(_config, '_load_config'):
-        _config._load_config()  # Force reload from disk
-    
+    if not _state.config:
+        config_path = os.path.join(_state.api.config_dir_path, "config.json")
+        _state.config = SynologyConfig(config_path)
+    elif hasattr(_state.config, '_load_config'):
+        _state.config._load_config()  # Force reload from disk
+
     # Handle client reconnection with 2FA consideration
-    if _client:
-        if _client.connected:
+    if _state.client:
+        if _state.client.connected:
             _LOG.info("Client already connected - setting device state to CONNECTED")
-            await api.set_device_state(DeviceStates.CONNECTED)
+            await _state.api.set_device_state(DeviceStates.CONNECTED)
             return
         else:
             _LOG.info("Client exists but not connected - attempting 2FA-aware reconnection")
-            
+
             # CRITICAL: Use special reconnection method for 2FA environments
-            if hasattr(_client, 'reconnect_after_reboot'):
-                if await _client.reconnect_after_reboot():
+            if hasattr(_state.client, 'reconnect_after_reboot'):
+                if await _connect_with_timeout(_state.client.reconnect_after_reboot()):
                     _LOG.info("✅ 2FA-aware reconnection successful")
-                    await api.set_device_state(DeviceStates.CONNECTED)
+                    await _state.api.set_device_state(DeviceStates.CONNECTED)
                     return
                 else:
                     _LOG.warning("2FA-aware reconnection failed, trying standard reconnection")
-            
+
             # Fallback to standard reconnection
-            if await _client.connect():
+            if await _connect_with_timeout(_state.client.connect()):
                 _LOG.info("✅ Standard reconnection successful")
-                await api.set_device_state(DeviceStates.CONNECTED)
+                await _state.api.set_device_state(DeviceStates.CONNECTED)
                 return
             else:
                 _LOG.error("❌ All reconnection attempts failed")
-                await api.set_device_state(DeviceStates.ERROR)
+                await _state.api.set_device_state(DeviceStates.ERROR)
                 return
-    
+
     # If no client exists, try to recreate from config
-    if _config and _config.is_configured():
+    if _state.config and _state.config.is_configured():
         _LOG.info("No client exists but config available - recreating client")
-        
+
         try:
-            connection_params = _config.get_connection_params()
-            _client = SynologySystemClient(
+            connection_params = _state.config.get_connection_params()
+            # Go through the shared registry so the recreated session is the
+            # one a later reconfigure for the same target finds and reuses
+            _state.client = SynologySystemClient.shared(
                 host=connection_params["host"],
                 port=connection_params["port"],
                 username=connection_params["username"],
@@ -153,106 +217,123 @@ async def on_connect() -> None:
                 secure=connection_params["secure"],
                 dsm_version=connection_params["dsm_version"],
                 otp_code=None,  # CRITICAL: No OTP for reconnection
-                temperature_unit=_config.temperature_unit
+                temperature_unit=_state.config.temperature_unit
             )
-            
+
             # Mark as reconnection attempt
-            _client._initial_connection_made = True
-            
-            if await _client.connect():
+            _state.client._initial_connection_made = True
+
+            if await _connect_with_timeout(_state.client.connect()):
                 _LOG.info("✅ Client recreated and connected successfully")
-                await api.set_device_state(DeviceStates.CONNECTED)
+                await _state.api.set_device_state(DeviceStates.CONNECTED)
             else:
                 _LOG.error("❌ Failed to connect recreated client")
-                await api.set_device_state(DeviceStates.ERROR)
-                
+                await _state.api.set_device_state(DeviceStates.ERROR)
+
         except Exception as ex:
             _LOG.error(f"Error recreating client: {ex}")
-            await api.set_device_state(DeviceStates.ERROR)
+            await _state.api.set_device_state(DeviceStates.ERROR)
     else:
         _LOG.error("No configuration available for reconnection")
-        await api.set_device_state(DeviceStates.ERROR)
+        await _state.api.set_device_state(DeviceStates.ERROR)
 
 
 async def on_subscribe_entities(entity_ids: list[str]):
     """Handle entity subscriptions and push initial state."""
-    global _monitoring_task
     _LOG.info(f"Entities subscribed: {entity_ids}. Pushing initial state and starting monitoring.")
-    
+
     # CRITICAL: Verify client is connected before proceeding
-    if not _client or not _client.connected:
+    if not _state.client or not _state.client.connected:
         _LOG.warning("Client not connected during subscription - attempting reconnection")
-        if _client and hasattr(_client, 'reconnect_after_reboot'):
-            await _client.reconnect_after_reboot()
-        elif _client:
-            await _client.connect()
-    
-    # Push initial state for each subscribed entity
+        if _state.client and hasattr(_state.client, 'reconnect_after_reboot'):
+            await _connect_with_timeout(_state.client.reconnect_after_reboot())
+        elif _state.client:
+            await _connect_with_timeout(_state.client.connect())
+
+    # Push initial state for all subscribed entities concurrently; each push
+    # hits different endpoints, so there is no reason to serialize them
+    pushes = []
     for entity_id in entity_ids:
-        if _media_player and entity_id == _media_player.entity_id:
-            _LOG.info(f"Pushing initial state for system media player: {entity_id}")
-            await _media_player.push_initial_state()
-            
-        if _remote and entity_id == _remote.entity_id:
-            _LOG.info(f"Pushing initial state for remote: {entity_id}")
-            await _remote.push_initial_state()
-            
-        if _camera_monitor and entity_id == _camera_monitor.entity_id:
-            _LOG.info(f"Pushing initial state for camera monitor: {entity_id}")
-            await _camera_monitor.push_initial_state()
-    
+        entity = _state.entities.get(entity_id)
+        if entity is None:
+            _LOG.warning(f"Subscription for unknown entity: {entity_id}")
+            continue
+        _LOG.info(f"Pushing initial state for entity: {entity_id}")
+        pushes.append(entity.push_initial_state())
+
+    if pushes:
+        results = await asyncio.gather(*pushes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOG.error(f"Error pushing initial entity state: {result}")
+
     # Start background monitoring only after subscription
-    if not _monitoring_task or _monitoring_task.done():
-        if _client and _client.connected:
+    if not _state.monitoring_task or _state.monitoring_task.done():
+        if _state.client and _state.client.connected:
             _LOG.info("Starting background monitoring after entity subscription")
-            _monitoring_task = asyncio.create_task(_background_monitoring_loop())
+            _state.client.health_listener = _report_health_event
+            _state.monitoring_task = asyncio.create_task(_background_monitoring_loop())
         else:
             _LOG.warning("Cannot start monitoring - client not connected")
 
 
 async def _background_monitoring_loop():
-    """Background monitoring task with connection health checks."""
+    """Event-driven connection health monitoring.
+
+    The entity polling loops already exercise the DSM endpoints constantly;
+    the client reports every real fetch outcome through the health event
+    queue, so this loop normally just consumes those events instead of
+    issuing redundant probe requests. Only when no events arrive for a
+    while (nothing is polling) does it fall back to an active probe.
+    """
     _LOG.info("Background monitoring loop started")
+    _state.health_events = asyncio.Queue(maxsize=64)
     try:
         consecutive_failures = 0
         max_failures = 3
-        
+        reconnect_backoff = 1.0
+
         while True:
             try:
-                if _client and _client.connected:
-                    # Test connection health periodically
-                    try:
-                        test_data = await _client.get_system_overview()
-                        if test_data:
-                            consecutive_failures = 0  # Reset failure counter
-                        else:
-                            consecutive_failures += 1
-                            _LOG.warning(f"Connection health check failed ({consecutive_failures}/{max_failures})")
-                    except Exception as health_ex:
+                try:
+                    event = await asyncio.wait_for(
+                        _state.health_events.get(), timeout=_HEALTH_EVENT_TIMEOUT
+                    )
+                    if event == "ok":
+                        consecutive_failures = 0
+                    else:
                         consecutive_failures += 1
-                        _LOG.warning(f"Connection health check exception ({consecutive_failures}/{max_failures}): {health_ex}")
-                    
-                    # If too many consecutive failures, try reconnection
-                    if consecutive_failures >= max_failures:
-                        _LOG.warning("Too many health check failures - attempting reconnection")
-                        if hasattr(_client, 'reconnect_after_reboot'):
-                            if await _client.reconnect_after_reboot():
-                                _LOG.info("Health check reconnection successful")
+                        _LOG.warning(f"Health event reported failure ({consecutive_failures}/{max_failures})")
+                except asyncio.TimeoutError:
+                    # No entity traffic recently - probe the connection ourselves
+                    if _state.client and _state.client.connected:
+                        try:
+                            test_data = await _cached_overview()
+                            if test_data:
                                 consecutive_failures = 0
                             else:
-                                _LOG.error("Health check reconnection failed")
-                else:
-                    _LOG.warning("Client disconnected, pausing monitoring")
-                    consecutive_failures += 1
-                    
-                    # Try to reconnect if we have a client
-                    if _client and consecutive_failures >= max_failures:
-                        _LOG.info("Attempting automatic reconnection...")
-                        if hasattr(_client, 'reconnect_after_reboot'):
-                            await _client.reconnect_after_reboot()
-            
-                await asyncio.sleep(30)
-                
+                                consecutive_failures += 1
+                                _LOG.warning(f"Connection health check failed ({consecutive_failures}/{max_failures})")
+                        except Exception as health_ex:
+                            consecutive_failures += 1
+                            _LOG.warning(f"Connection health check exception ({consecutive_failures}/{max_failures}): {health_ex}")
+                    else:
+                        _LOG.warning("Client disconnected, pausing monitoring")
+                        consecutive_failures += 1
+
+                # If too many consecutive failures, try reconnection
+                if consecutive_failures >= max_failures:
+                    _LOG.warning("Too many health check failures - attempting reconnection")
+                    if _state.client and hasattr(_state.client, 'reconnect_after_reboot'):
+                        if await _connect_with_timeout(_state.client.reconnect_after_reboot()):
+                            _LOG.info("Health check reconnection successful")
+                            consecutive_failures = 0
+                            reconnect_backoff = 1.0
+                        else:
+                            _LOG.error(f"Health check reconnection failed - backing off {reconnect_backoff:.0f}s")
+                            await asyncio.sleep(reconnect_backoff)
+                            reconnect_backoff = min(60.0, reconnect_backoff * 2)
+
             except asyncio.CancelledError:
                 _LOG.info("Background monitoring loop cancelled")
                 break
@@ -260,41 +341,75 @@ async def _background_monitoring_loop():
                 _LOG.error(f"Error in background monitoring: {ex}")
                 consecutive_failures += 1
                 await asyncio.sleep(60)  # Longer delay on error
-                
+
     except Exception as ex:
         _LOG.error(f"Critical error in monitoring loop: {ex}")
+    finally:
+        _state.health_events = None
 
 
 async def on_disconnect() -> None:
     """Handle Remote Two disconnection."""
-    global _monitoring_task
     _LOG.info("Remote Two disconnected. Setting device state to DISCONNECTED.")
-    await api.set_device_state(DeviceStates.DISCONNECTED)
-    
+    await _state.api.set_device_state(DeviceStates.DISCONNECTED)
+
     # Cancel background monitoring
-    if _monitoring_task and not _monitoring_task.done():
-        _monitoring_task.cancel()
+    if _state.monitoring_task and not _state.monitoring_task.done():
+        _state.monitoring_task.cancel()
         try:
-            await _monitoring_task
+            await _state.monitoring_task
         except asyncio.CancelledError:
             pass
-        _monitoring_task = None
-    
-    if _media_player:
-        await _media_player.stop()
-        
-    if _camera_monitor:
-        await _camera_monitor.stop()
-    
+        _state.monitoring_task = None
+
+    if _state.media_player:
+        await _state.media_player.stop()
+
+    if _state.camera_monitor:
+        await _state.camera_monitor.stop()
+
     # CRITICAL: DO NOT disconnect client on Remote disconnect
     # Keep Synology session alive for reboot survival
     _LOG.info("Keeping Synology session alive for reboot survival")
 
 
+def _enable_orjson_serialization() -> None:
+    """Route ucapi's websocket JSON encoding through orjson when available.
+
+    The attribute pushes can carry multi-hundred-KB base64 image payloads;
+    orjson encodes those several times faster than stdlib json. Best-effort:
+    silently keeps stdlib json when orjson is missing or ucapi internals move.
+    """
+    try:
+        import orjson
+    except ImportError:
+        _LOG.debug("orjson not installed - using stdlib json for attribute pushes")
+        return
+
+    try:
+        import ucapi.api as ucapi_api
+
+        class _OrjsonShim:
+            loads = staticmethod(orjson.loads)
+
+            @staticmethod
+            def dumps(obj, **_kwargs):
+                return orjson.dumps(obj).decode()
+
+        ucapi_api.json = _OrjsonShim
+        _LOG.info("ucapi JSON serialization routed through orjson")
+    except Exception as ex:
+        _LOG.debug(f"Could not enable orjson serialization: {ex}")
+
+
+@functools.lru_cache(maxsize=1)
 def find_driver_json() -> str:
-    """Find driver.json file with robust path resolution."""
+    """Find driver.json file with robust path resolution.
+
+    The location never changes within a process, so the search runs once.
+    """
     search_paths = []
-    
+
     if __package__:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(current_dir)
@@ -306,53 +421,49 @@ def find_driver_json() -> str:
             os.path.join(current_dir, "driver.json"),
             os.path.join(os.getcwd(), "driver.json")
         ])
-    
+
     for path in search_paths:
         abs_path = os.path.abspath(path)
         if os.path.exists(abs_path):
             return abs_path
-    
+
     search_details = "\n".join(f"  {i+1}. {os.path.abspath(path)}" for i, path in enumerate(search_paths))
     raise FileNotFoundError(f"driver.json not found. Searched paths:\n{search_details}")
 
 
 async def main():
     """Main integration entry point."""
-    global api
-    
     try:
-        logging.basicConfig(
-            level=logging.DEBUG, 
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         _LOG.info(f"Starting Synology Integration Driver with 2FA reboot survival")
-        
+
+        _enable_orjson_serialization()
+
         loop = asyncio.get_running_loop()
-        api = ucapi.IntegrationAPI(loop)
-        
+        _state.api = ucapi.IntegrationAPI(loop)
+
         # Add event listeners
-        api.add_listener(Events.CONNECT, on_connect)
-        api.add_listener(Events.DISCONNECT, on_disconnect)
-        api.add_listener(Events.SUBSCRIBE_ENTITIES, on_subscribe_entities)
-        
+        _state.api.add_listener(Events.CONNECT, on_connect)
+        _state.api.add_listener(Events.DISCONNECT, on_disconnect)
+        _state.api.add_listener(Events.SUBSCRIBE_ENTITIES, on_subscribe_entities)
+
         # Find and initialize with driver.json
         driver_json_path = find_driver_json()
-        await api.init(driver_json_path, setup_handler_wrapper)
-        await api.set_device_state(DeviceStates.DISCONNECTED)
-        
+        await _state.api.init(driver_json_path, setup_handler_wrapper)
+        await _state.api.set_device_state(DeviceStates.DISCONNECTED)
+
         _LOG.info("Driver initialized. Waiting for remote connection and setup.")
         await asyncio.Future()
-        
+
     except asyncio.CancelledError:
         _LOG.info("Driver task cancelled.")
     finally:
-        if _monitoring_task:
-            _monitoring_task.cancel()
+        if _state.monitoring_task:
+            _state.monitoring_task.cancel()
         # Only disconnect on final shutdown, not on Remote disconnect
-        if _client:
-            await _client.disconnect()
+        if _state.client:
+            await _state.client.disconnect()
         _LOG.info("Synology Integration Driver has stopped.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -5,12 +5,39 @@ Enhanced helper functions and constants for Synology System integration.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import functools
 import logging
+import re
+import socket
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
 _LOG = logging.getLogger(__name__)
 
+# Resolved once at import; every asset lives under this directory
+_ASSETS_DIR = Path(__file__).parent.parent / "assets" / "icons"
+
+# Source -> icon filename mapping, shared by all get_source_icon_path calls
+_ICON_MAP = {
+    "SYSTEM_OVERVIEW": "system_overview.png",
+    "STORAGE_STATUS": "storage_status.png",
+    "NETWORK_STATS": "network_stats.png",
+    "SERVICES_STATUS": "services_status.png",
+    "SECURITY_STATUS": "security_status.png",
+    "DOCKER_STATUS": "docker_status.png",
+    "THERMAL_STATUS": "thermal_status.png",
+    "CACHE_STATUS": "cache_status.png",
+    "RAID_STATUS": "raid_status.png",
+    "VOLUME_STATUS": "volume_status.png",
+    "UPS_STATUS": "ups_status.png",
+    "HARDWARE_MONITOR": "hardware_monitor.png",
+    "DRIVE_HEALTH": "drive_health.png",
+    "POWER_MANAGEMENT": "power_management.png",
+    "CACHE_PERFORMANCE": "cache_performance.png",
+    "PACKAGE_MANAGER": "package_manager.png",
+    "USER_SESSIONS": "user_sessions.png"
+}
+
 
 class SynologyConstants:
     """Enhanced constants for Synology integration."""
@@ -73,6 +100,7 @@ def celsius_to_fahrenheit(celsius: float) -> float:
     return (celsius * 9/5) + 32
 
 
+@functools.lru_cache(maxsize=256)
 def format_temperature(temp_celsius: float, unit: str = "celsius") -> str:
     """Format temperature with appropriate unit."""
     if unit.lower() == "fahrenheit":
@@ -81,26 +109,30 @@ def format_temperature(temp_celsius: float, unit: str = "celsius") -> str:
     return f"{temp_celsius:.1f}°C"
 
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Shared result strings for the common idle/empty cases, so hot formatting
+# paths return one interned object instead of building a fresh string
+_ZERO_BYTES = "0 B"
+_ZERO_SECONDS = "0 seconds"
+_LT_MIN = "< 1m"
+_NA = "N/A"
+
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human readable format."""
-    if bytes_value == 0:
-        return "0 B"
-    
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    unit_index = 0
-    size = float(bytes_value)
-    
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
-    
-    return f"{size:.1f} {units[unit_index]}"
+    if bytes_value <= 0:
+        return _ZERO_BYTES
+
+    # bit_length picks the 1024^n bucket directly instead of dividing in a loop
+    exponent = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (exponent * 10)):.1f} {_BYTE_UNITS[exponent]}"
 
 
 def format_uptime(total_seconds: int) -> str:
     """Format uptime in human readable format."""
     if total_seconds == 0:
-        return "0 seconds"
+        return _ZERO_SECONDS
     
     days = total_seconds // 86400
     hours = (total_seconds % 86400) // 3600
@@ -114,37 +146,44 @@ def format_uptime(total_seconds: int) -> str:
     if minutes > 0:
         parts.append(f"{minutes}m")
     
-    return " ".join(parts) if parts else "< 1m"
+    return " ".join(parts) if parts else _LT_MIN
+
+
+# Matches the leading "days:hours:minutes" triple of a DSM uptime string
+_UPTIME_RE = re.compile(r'^\s*(\d+):(\d+):(\d+)')
 
 
 def parse_uptime_string(uptime_str: str) -> int:
     """Parse uptime string to seconds."""
     try:
         # Format: "days:hours:minutes" or similar
-        parts = uptime_str.split(':')
-        if len(parts) >= 3:
-            days, hours, minutes = map(int, parts[:3])
+        match = _UPTIME_RE.match(uptime_str)
+        if match:
+            days, hours, minutes = map(int, match.groups())
             return days * 86400 + hours * 3600 + minutes * 60
-    except (ValueError, AttributeError):
+    except TypeError:
         pass
     return 0
 
 
+@functools.lru_cache(maxsize=128)
 def get_asset_path(filename: str) -> str:
-    """Get full path to asset file with enhanced error handling."""
+    """Get full path to asset file with enhanced error handling.
+
+    Asset files never change at runtime, so resolved paths (including the
+    existence check) are memoized per filename.
+    """
     try:
-        current_file = Path(__file__)
-        assets_dir = current_file.parent.parent / "assets" / "icons"
-        asset_path = assets_dir / filename
-        
+        asset_path = _ASSETS_DIR / filename
+
         if asset_path.exists():
             return str(asset_path)
         else:
             _LOG.warning(f"Asset file not found: {asset_path}")
             # Return default synology logo path
-            default_path = assets_dir / "synology_logo.png"
+            default_path = _ASSETS_DIR / "synology_logo.png"
             return str(default_path)
-            
+
     except Exception as ex:
         _LOG.error(f"Error getting asset path for {filename}: {ex}")
         return ""
@@ -153,12 +192,12 @@ def get_asset_path(filename: str) -> str:
 def validate_ip_address(ip_string: str) -> bool:
     """Validate IP address format."""
     try:
-        parts = ip_string.split('.')
-        if len(parts) != 4: return False
-        for part in parts:
-            if not 0 <= int(part) <= 255: return False
+        # inet_aton accepts short forms like "1.2.3"; require dotted quad
+        if ip_string.count('.') != 3:
+            return False
+        socket.inet_aton(ip_string)
         return True
-    except (ValueError, AttributeError):
+    except (OSError, TypeError, AttributeError):
         return False
 
 
@@ -167,33 +206,20 @@ def validate_port(port: int) -> bool:
     return 1 <= port <= 65535
 
 
+# Source icons resolved to absolute paths on first lookup, not at import:
+# resolving eagerly would log a missing-asset warning per entry on every
+# driver start even when no caller ever asks for an icon path. The
+# "__default__" entry backs unknown sources
+_RESOLVED_ICONS: Dict[str, str] = {}
+
+
 def get_source_icon_path(source: str) -> str:
     """Get icon path for media player source with enhanced mapping."""
-    icon_mapping = {
-        "SYSTEM_OVERVIEW": "system_overview.png",
-        "STORAGE_STATUS": "storage_status.png", 
-        "NETWORK_STATS": "network_stats.png",
-        "SERVICES_STATUS": "services_status.png",
-        "SECURITY_STATUS": "security_status.png",
-        "DOCKER_STATUS": "docker_status.png",
-        "THERMAL_STATUS": "thermal_status.png",
-        "CACHE_STATUS": "cache_status.png",
-        "RAID_STATUS": "raid_status.png",
-        "VOLUME_STATUS": "volume_status.png",
-        "UPS_STATUS": "ups_status.png",
-        # NEW ENHANCED SOURCES
-        "HARDWARE_MONITOR": "hardware_monitor.png",
-        "DRIVE_HEALTH": "drive_health.png",
-        "POWER_MANAGEMENT": "power_management.png",
-        "CACHE_PERFORMANCE": "cache_performance.png",
-        "PACKAGE_MANAGER": "package_manager.png",
-        "USER_SESSIONS": "user_sessions.png"
-    }
-    
-    icon_filename = icon_mapping.get(source, "synology_logo.png")
-    icon_path = get_asset_path(icon_filename)
-    
-    return icon_path
+    if not _RESOLVED_ICONS:
+        for src, filename in _ICON_MAP.items():
+            _RESOLVED_ICONS[src] = get_asset_path(filename)
+        _RESOLVED_ICONS["__default__"] = get_asset_path("synology_logo.png")
+    return _RESOLVED_ICONS.get(source) or _RESOLVED_ICONS["__default__"]
 
 
 def safe_get_nested_value(data: Dict[str, Any], keys: List[str], default: Any = None) -> Any:
@@ -256,10 +282,11 @@ def format_cache_hit_rate(hit_rate: float) -> str:
         return f"{hit_rate:.1f}% (Poor)"
 
 
+@functools.lru_cache(maxsize=256)
 def format_drive_temperature(temp: int, is_ssd: bool = False) -> str:
     """Format drive temperature with health indication."""
     if temp == 0:
-        return "N/A"
+        return _NA
     
     # Different thresholds for SSD vs HDD
     if is_ssd:
@@ -298,13 +325,14 @@ def parse_ups_runtime(runtime_minutes: int) -> str:
         return f"{minutes}m"
 
 
-def get_performance_indicator(value: float, thresholds: Dict[str, float]) -> str:
+def get_performance_indicator(value: float, excellent: float = 90.0,
+                              good: float = 75.0, fair: float = 50.0) -> str:
     """Get performance indicator based on value and thresholds."""
-    if value >= thresholds.get('excellent', 90):
+    if value >= excellent:
         return "🟢 Excellent"
-    elif value >= thresholds.get('good', 75):
+    elif value >= good:
         return "🟡 Good"
-    elif value >= thresholds.get('fair', 50):
+    elif value >= fair:
         return "🟠 Fair"
     else:
         return "🔴 Poor"
\ No newline at end of file
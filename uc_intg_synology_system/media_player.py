@@ -9,8 +9,17 @@ import asyncio
 import base64
 import logging
 import os
+import random
+import socket
+from itertools import islice
 from typing import Any, Dict
 
+try:
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 import ucapi
 from ucapi import StatusCodes
 from ucapi.media_player import Attributes, Commands, Features, MediaPlayer, States
@@ -21,8 +30,103 @@ from uc_intg_synology_system.helpers import create_two_line_display
 
 _LOG = logging.getLogger(__name__)
 
+# Source display name -> icon filename; static for the life of the driver
+_SOURCE_IMAGES = {
+    "System Overview": "system_overview.png",
+    "Storage Status": "storage_status.png",
+    "Network Statistics": "network_stats.png",
+    "Services Status": "services_status.png",
+    "Security Status": "security_status.png",
+    "Docker Containers": "docker_status.png",
+    "Surveillance Station": "surveillance_status.png",
+    "Temperature Monitor": "thermal_status.png",
+    "SSD Cache": "cache_status.png",
+    "RAID Health": "raid_status.png",
+    "Volume Usage": "volume_status.png",
+    "UPS Monitor": "ups_status.png",
+    # Enhanced source mappings
+    "Hardware Monitor": "hardware_monitor.png",
+    "Drive Health": "drive_health.png",
+    "Power Management": "power_management.png",
+    "Cache Performance": "cache_performance.png",
+    "Package Manager": "package_manager.png",
+    "User Sessions": "user_sessions.png"
+}
+
+# Tried in order when a source icon is missing on disk
+_FALLBACK_ICONS = ("synology_logo.png", "system_overview.png")
+
+# Icon locations resolved once at import; nothing under the package dir
+# moves at runtime
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+_ALL_ICON_NAMES = frozenset(_SOURCE_IMAGES.values()) | frozenset(_FALLBACK_ICONS)
+_ICON_PATHS = {name: os.path.join(_ICON_DIR, name) for name in _ALL_ICON_NAMES}
+
+# Source key -> client fetcher / display updater method names; bound into
+# per-instance dispatch dicts once in __init__
+_FETCHER_NAMES = {
+    "SYSTEM_OVERVIEW": "get_system_overview",
+    "STORAGE_STATUS": "get_storage_status",
+    "NETWORK_STATS": "get_network_stats",
+    "SERVICES_STATUS": "get_services_status",
+    "SECURITY_STATUS": "get_security_status",
+    "DOCKER_STATUS": "get_docker_status",
+    "SURVEILLANCE_STATUS": "get_surveillance_status",
+    "THERMAL_STATUS": "get_thermal_status",
+    "CACHE_STATUS": "get_cache_status",
+    "RAID_STATUS": "get_raid_status",
+    "VOLUME_STATUS": "get_volume_status",
+    "UPS_STATUS": "get_ups_status",
+    # Enhanced monitoring sources
+    "HARDWARE_MONITOR": "get_hardware_monitor",
+    "DRIVE_HEALTH": "get_drive_health",
+    "POWER_MANAGEMENT": "get_power_management",
+    "CACHE_PERFORMANCE": "get_cache_performance",
+    "PACKAGE_MANAGER": "get_package_manager",
+    "USER_SESSIONS": "get_user_sessions",
+}
+
+_UPDATER_NAMES = {
+    "SYSTEM_OVERVIEW": "_update_system_overview_display",
+    "STORAGE_STATUS": "_update_storage_status_display",
+    "NETWORK_STATS": "_update_network_stats_display",
+    "SERVICES_STATUS": "_update_services_status_display",
+    "SECURITY_STATUS": "_update_security_status_display",
+    "DOCKER_STATUS": "_update_docker_status_display",
+    "SURVEILLANCE_STATUS": "_update_surveillance_status_display",
+    "THERMAL_STATUS": "_update_thermal_status_display",
+    "CACHE_STATUS": "_update_cache_status_display",
+    "RAID_STATUS": "_update_raid_status_display",
+    "VOLUME_STATUS": "_update_volume_status_display",
+    "UPS_STATUS": "_update_ups_status_display",
+    "HARDWARE_MONITOR": "_update_hardware_monitor_display",
+    "DRIVE_HEALTH": "_update_drive_health_display",
+    "POWER_MANAGEMENT": "_update_power_management_display",
+    "CACHE_PERFORMANCE": "_update_cache_performance_display",
+    "PACKAGE_MANAGER": "_update_package_manager_display",
+    "USER_SESSIONS": "_update_user_sessions_display",
+}
+
+# Base polling interval per source key (seconds): volatile sources poll
+# fast, near-static ones slowly. Unchanged renders back off further.
+_BASE_INTERVALS = {
+    "SYSTEM_OVERVIEW": 5,
+    "NETWORK_STATS": 5,
+    "STORAGE_STATUS": 30,
+    "DRIVE_HEALTH": 45,
+    "SECURITY_STATUS": 60,
+    "PACKAGE_MANAGER": 60,
+    "USER_SESSIONS": 60,
+}
+_DEFAULT_INTERVAL = 15
+_MAX_BACKOFF = 300
+
+# Port for the optional local icon HTTP server (snapshot_http_server
+# feature); distinct from the camera snapshot server's port
+_ICON_SERVER_PORT = 8788
+
 # Commands to suppress to prevent red error messages and accidental system actions
-SUPPRESSED_COMMANDS = [
+SUPPRESSED_COMMANDS = frozenset({
     Commands.PLAY_PAUSE,
     Commands.STOP,
     Commands.SHUFFLE,
@@ -36,11 +140,41 @@ SUPPRESSED_COMMANDS = [
     Commands.MY_RECORDINGS,
     Commands.EJECT,
     Commands.OPEN_CLOSE,
-]
+})
+
+# Custom refresh commands handled outside the standard media-player set
+_CUSTOM_COMMANDS = frozenset({"REFRESH_STATUS", "UPDATE_DISPLAY", "SYSTEM_INFO"})
+
+# System package name prefixes excluded from the "major" package count
+_SYS_PREFIXES = ('SYNO.Core', 'SYNO.API')
+
+# Pushed once when the client drops; further ticks are skipped until the
+# connection comes back
+_DISCONNECTED_DIFF = {
+    Attributes.STATE: States.PAUSED,
+    Attributes.MEDIA_TITLE: "Disconnected",
+    Attributes.MEDIA_ARTIST: "Reconnecting...",
+}
+
+# Effective polling interval while the client is disconnected
+_DISCONNECTED_INTERVAL = 30.0
 
 
 class SynologySystemDashboard:
 
+    # Slots keep the controller's many per-poll attribute reads on the fast
+    # C-level path and drop the per-instance __dict__
+    __slots__ = (
+        "_api", "_client", "_config", "_current_source", "_sources",
+        "_name_to_key", "_polling_task", "_last_data", "_last_pushed",
+        "_backoff", "_wake", "_shutdown", "_inflight", "_was_connected",
+        "_recent_sources", "_fetch_sem", "_fail_count", "_render_cache",
+        "_unavailable_diff", "_icon_cache", "_fallback_url",
+        "_source_image_url", "_data_image_url", "_data_fallback_url",
+        "_http_runner", "_http_base_url", "_cmd_handlers", "_entity",
+        "_fetchers", "_updaters",
+    )
+
     def __init__(self, api: ucapi.IntegrationAPI, client: SynologySystemClient, config: SynologyConfig):
         """
         Initialize system dashboard.
@@ -54,10 +188,70 @@ class SynologySystemDashboard:
         self._config = config
         self._current_source = "System Overview"
         self._sources = self._get_enabled_sources()
+        # Reverse lookup: source display name -> internal key (O(1) per poll)
+        self._name_to_key = {name: key for key, name in self._sources.items()}
         self._polling_task = None
         self._last_data = {}
+        # Last diff pushed per source, for steady-state RPC dedupe
+        self._last_pushed: Dict[str, Dict[str, Any]] = {}
+        # Current adaptive interval per source key; resets to the base on
+        # change or source selection, doubles while renders stay identical
+        self._backoff: Dict[str, float] = {}
+        # Wakes the polling loop immediately on source switches instead of
+        # waiting out the remainder of the current interval
+        self._wake = asyncio.Event()
+        # Set by stop(); the loop and in-flight fetches wind down promptly
+        self._shutdown = asyncio.Event()
+        # One in-flight fetch per source: overlapping refreshes (slow DSM +
+        # rapid source cycling) share the pending task instead of stacking
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Connection state edge detection for the disconnected fast path
+        self._was_connected = True
+        # Recently viewed sources (display names, most recent last), warmed
+        # each tick so switching back renders from the client's cache
+        self._recent_sources: list = []
+        # Bounds concurrent DSM calls during prefetch; DSM throttles hard
+        # beyond a handful of simultaneous authenticated requests
+        self._fetch_sem = asyncio.Semaphore(4)
+        # Consecutive transient-error count driving the jittered retry delay
+        self._fail_count = 0
+        # Last (payload, rendered diff) per source: steady-state payloads
+        # (UPS, RAID, packages) reuse the rendered strings instead of
+        # re-running .title()/f-string work every tick
+        self._render_cache: Dict[str, tuple] = {}
+        # Prebuilt per-source "unavailable" diff: empty or failed fetches
+        # push these shared dicts with zero per-tick formatting
+        self._unavailable_diff = {
+            name: {Attributes.MEDIA_TITLE: name,
+                   Attributes.MEDIA_ARTIST: "Information unavailable"}
+            for name in self._sources.values()
+        }
         self._icon_cache = {}  # Cache for base64 icons
-        
+        # Icon reading/encoding is deferred to push_initial_state (off the
+        # event loop via to_thread); init stays free of disk I/O
+        self._fallback_url = ""
+        self._source_image_url: Dict[str, str] = {}
+        # Data-URL map kept for fallback when the icon HTTP server is off
+        self._data_image_url: Dict[str, str] = {}
+        self._data_fallback_url = ""
+        self._http_runner = None
+        self._http_base_url = None
+        # O(1) command dispatch; every handler takes the command params
+        self._cmd_handlers = {
+            Commands.SELECT_SOURCE: self._cmd_select_source,
+            Commands.ON: self._handle_power_on,
+            Commands.OFF: self._handle_power_off,
+            Commands.VOLUME_UP: self._handle_navigate_next,
+            Commands.VOLUME_DOWN: self._handle_navigate_previous,
+        }
+
+        # Bound fetcher/updater per source key, resolved once so the
+        # per-tick dispatch is a single dict probe
+        self._fetchers = {key: getattr(self._client, name)
+                          for key, name in _FETCHER_NAMES.items()}
+        self._updaters = {key: getattr(self, name)
+                          for key, name in _UPDATER_NAMES.items()}
+
         _LOG.info(f"Initializing dashboard with sources: {list(self._sources.keys())}")
         
         self._entity = self._create_media_player_entity()
@@ -69,72 +263,73 @@ class SynologySystemDashboard:
         
         # Limit to 25 sources maximum for media player
         if len(sources) > 25:
-            _LOG.warning(f"Too many sources ({len(sources)}), limiting to 20")
-            source_items = list(sources.items())[:25]
-            sources = dict(source_items)
-        
-        return sources
+            _LOG.warning(f"Too many sources ({len(sources)}), limiting to 25")
+            sources = dict(islice(sources.items(), 25))
 
-    def _get_icon_base64(self, icon_filename: str) -> str:
-        if icon_filename in self._icon_cache:
-            return self._icon_cache[icon_filename]
+        return sources
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_dir = os.path.join(script_dir, "icons")
-        icon_path = os.path.join(icon_dir, icon_filename)
-        
-        fallback_icons = ["synology_logo.png", "system_overview.png"]
-
-        if not os.path.exists(icon_path):
-            _LOG.warning(f"Icon not found: {icon_filename}")
-            for fallback in fallback_icons:
-                icon_path = os.path.join(icon_dir, fallback)
-                if os.path.exists(icon_path):
-                    _LOG.info(f"Using fallback icon: {fallback}")
-                    break
-            else:
-                _LOG.error("No fallback icons found")
-                return ""
+    def _preload_icons(self) -> None:
+        """Read and base64-encode every known source icon in one pass.
 
+        The icon set is statically enumerated, so loading it up front turns
+        every later icon access into a plain dict lookup with no filesystem
+        syscalls on the source-switch path.
+        """
         try:
-            with open(icon_path, 'rb') as f:
-                icon_data = f.read()
-                base64_data = base64.b64encode(icon_data).decode('utf-8')
-                data_url = f"data:image/png;base64,{base64_data}"
-                self._icon_cache[icon_filename] = data_url
-                _LOG.info(f"Loaded and cached icon: {icon_filename}")
-                return data_url
-        except Exception as e:
-            _LOG.error(f"Failed to read icon {icon_path}: {e}")
-            return ""
+            # One scandir pass yields names and sizes without extra stat calls
+            with os.scandir(_ICON_DIR) as entries:
+                existing = {entry.name: entry.stat().st_size
+                            for entry in entries if entry.is_file()}
+        except OSError as ex:
+            _LOG.error(f"Cannot scan icon directory {_ICON_DIR}: {ex}")
+            return
+
+        for name in _ALL_ICON_NAMES & existing.keys():
+            try:
+                fd = os.open(_ICON_PATHS[name], os.O_RDONLY)
+                try:
+                    icon_data = os.read(fd, existing[name])
+                finally:
+                    os.close(fd)
+                # Stay in bytes until the final decode; ascii skips utf-8
+                # validation of the base64 payload
+                self._icon_cache[name] = (
+                    b'data:image/png;base64,' + base64.b64encode(icon_data)
+                ).decode('ascii')
+            except OSError as ex:
+                _LOG.error(f"Failed to read icon {name}: {ex}")
 
-    def _get_source_image(self, source: str) -> str:
-        """Get the proper base64 image data for a given source with complete mapping."""
-        source_images = {
-            "System Overview": "system_overview.png",
-            "Storage Status": "storage_status.png", 
-            "Network Statistics": "network_stats.png",
-            "Services Status": "services_status.png",
-            "Security Status": "security_status.png",
-            "Docker Containers": "docker_status.png",
-            "Surveillance Station": "surveillance_status.png",
-            "Temperature Monitor": "thermal_status.png",
-            "SSD Cache": "cache_status.png",
-            "RAID Health": "raid_status.png",
-            "Volume Usage": "volume_status.png",
-            "UPS Monitor": "ups_status.png",
-            # Enhanced source mappings
-            "Hardware Monitor": "hardware_monitor.png",
-            "Drive Health": "drive_health.png", 
-            "Power Management": "power_management.png",
-            "Cache Performance": "cache_performance.png",
-            "Package Manager": "package_manager.png",
-            "User Sessions": "user_sessions.png"
+        missing = _ALL_ICON_NAMES - existing.keys()
+        if missing:
+            _LOG.warning(f"Icons not found on disk: {sorted(missing)}")
+        _LOG.info(f"Preloaded {len(self._icon_cache)} source icons")
+
+    def _load_icon_urls(self) -> None:
+        """Preload icons and build the per-source data-URL maps.
+
+        Blocking (disk reads + base64); runs in a worker thread from
+        push_initial_state so the event loop stays responsive at startup.
+        """
+        self._preload_icons()
+        self._fallback_url = self._get_icon_base64("synology_logo.png")
+        # Final data-URL per source display name, so selection handling is a
+        # single lookup with no mapping or encoding work per switch
+        self._source_image_url = {
+            name: self._get_icon_base64(_SOURCE_IMAGES.get(name, "synology_logo.png"))
+            for name in self._sources.values()
         }
-        
-        image_filename = source_images.get(source, "synology_logo.png")
-        _LOG.debug(f"Source '{source}' mapped to icon '{image_filename}'")
-        return self._get_icon_base64(image_filename)
+        self._data_image_url = dict(self._source_image_url)
+        self._data_fallback_url = self._fallback_url
+
+    def _get_icon_base64(self, icon_filename: str) -> str:
+        cached = self._icon_cache.get(icon_filename)
+        if cached is not None:
+            return cached
+        for fallback in _FALLBACK_ICONS:
+            cached = self._icon_cache.get(fallback)
+            if cached is not None:
+                return cached
+        return ""
 
     def _create_media_player_entity(self) -> MediaPlayer:
         """Create media player entity for system dashboard."""
@@ -147,20 +342,17 @@ class SynologySystemDashboard:
             Features.MEDIA_IMAGE_URL,
         ]
         
-        initial_icon_base64 = self._get_source_image(self._current_source)
-        
         attributes = {
             Attributes.STATE: States.PAUSED,
             Attributes.SOURCE: self._current_source,
             Attributes.SOURCE_LIST: list(self._sources.values()),
             Attributes.MEDIA_TITLE: "Synology System Monitor",
             Attributes.MEDIA_ARTIST: "Initializing...",
-            Attributes.MEDIA_IMAGE_URL: initial_icon_base64,
+            # Real icon assigned in push_initial_state once icons are loaded
+            Attributes.MEDIA_IMAGE_URL: "",
             Attributes.VOLUME: 50
         }
-        
-        _LOG.debug(f"Created media player with base64 icon loaded: {bool(initial_icon_base64)}")
-        
+
         return MediaPlayer(
             identifier="synology_system_dashboard",
             name="Synology System Monitor",
@@ -171,182 +363,215 @@ class SynologySystemDashboard:
 
     async def handle_command(self, entity_arg: ucapi.entity.Entity, cmd_id: str, params: Dict[str, Any] = None) -> StatusCodes:
         """Handle media player commands - HTCP exact pattern."""
-        _LOG.debug(f"Received command: {cmd_id} with params: {params}")
+        _LOG.debug("Received command: %s with params: %s", cmd_id, params)
         
         try:
-            if cmd_id == Commands.SELECT_SOURCE:
-                source = params.get("source") if params else None
-                if source:
-                    await self._handle_source_selection(source)
-                    return StatusCodes.OK
-                return StatusCodes.BAD_REQUEST
-            elif cmd_id == Commands.ON:
-                await self._handle_power_on()
-                return StatusCodes.OK
-            elif cmd_id == Commands.OFF:
-                await self._handle_power_off()
-                return StatusCodes.OK
-            elif cmd_id == Commands.VOLUME_UP:
-                await self._handle_navigate_next()
-                return StatusCodes.OK
-            elif cmd_id == Commands.VOLUME_DOWN:
-                await self._handle_navigate_previous()
-                return StatusCodes.OK
-            elif cmd_id in SUPPRESSED_COMMANDS:
+            handler = self._cmd_handlers.get(cmd_id)
+            if handler is not None:
+                # Handlers return a status code or None for plain OK
+                return await handler(params) or StatusCodes.OK
+            if cmd_id in SUPPRESSED_COMMANDS:
                 # HTCP exact pattern - silently ignore to prevent red errors
-                _LOG.debug(f"Ignoring unsupported media command '{cmd_id}' to prevent UI error.")
+                _LOG.debug("Ignoring unsupported media command '%s' to prevent UI error.", cmd_id)
                 return StatusCodes.OK
-            elif cmd_id in ["REFRESH_STATUS", "UPDATE_DISPLAY", "SYSTEM_INFO"]:
+            if cmd_id in _CUSTOM_COMMANDS:
                 await self._handle_custom_command(cmd_id, params)
                 return StatusCodes.OK
-            else:
-                _LOG.warning(f"Unhandled command: {cmd_id}")
-                return StatusCodes.NOT_IMPLEMENTED
-                
+            _LOG.warning(f"Unhandled command: {cmd_id}")
+            return StatusCodes.NOT_IMPLEMENTED
+
         except Exception as ex:
             _LOG.error(f"Error handling command '{cmd_id}': {ex}")
             return StatusCodes.SERVER_ERROR
 
+    def _apply_and_push(self, diff: Dict[str, Any]) -> None:
+        """Persist an attribute diff into the entity and push only those keys.
+
+        Steady-state sources (UPS, packages, ...) render the same strings
+        tick after tick; identical diffs skip the remote RPC entirely.
+        """
+        if not diff:
+            return
+        self._entity.attributes.update(diff)
+        last = self._last_pushed.get(self._current_source)
+        if last == diff:
+            return
+        if last:
+            # Ship only the keys whose values actually differ from the last
+            # push; a title-only change no longer re-sends the artist line
+            delta = {k: v for k, v in diff.items() if last.get(k) != v}
+        else:
+            delta = diff
+        self._last_pushed[self._current_source] = diff
+        if delta:
+            self._api.configured_entities.update_attributes(self.entity_id, delta)
+
     async def push_initial_state(self) -> None:
         """Fetch initial data, push it to the remote, and start monitoring - HTCP pattern."""
         try:
             _LOG.info("Pushing initial state for Synology System Dashboard.")
+            if not self._icon_cache:
+                await asyncio.to_thread(self._load_icon_urls)
             await self._update_source_display()
+            # First push ships the full attribute set (source list, icon, ...)
             self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
             await self.start()
         except Exception as ex:
             _LOG.error(f"Error pushing initial state for dashboard: {ex}", exc_info=True)
 
+    async def _cmd_select_source(self, params: Dict[str, Any] = None) -> StatusCodes:
+        """Dispatch-table wrapper validating the source parameter."""
+        source = params.get("source") if params else None
+        if not source:
+            return StatusCodes.BAD_REQUEST
+        await self._handle_source_selection(source)
+        return StatusCodes.OK
+
     async def _handle_source_selection(self, source_name: str) -> None:
         """Handle source selection - HTCP exact pattern."""
         if source_name != self._current_source:
             _LOG.info(f"Switching monitoring view to: {source_name}")
+            previous = self._current_source
+            if previous in self._recent_sources:
+                self._recent_sources.remove(previous)
+            self._recent_sources.append(previous)
+            # Keep only the last few views worth prefetching
+            del self._recent_sources[:-3]
             self._current_source = source_name
-            self._entity.attributes[Attributes.SOURCE] = source_name
-            self._entity.attributes[Attributes.MEDIA_IMAGE_URL] = self._get_source_image(source_name)
-            await self._update_current_data()
-            self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+            self._backoff.pop(self._name_to_key.get(source_name, source_name), None)
+            self._apply_and_push({
+                Attributes.SOURCE: source_name,
+                Attributes.MEDIA_IMAGE_URL: self._source_image_url.get(source_name, self._fallback_url)
+            })
+            # The polling loop fetches the new source's data immediately
+            self._wake.set()
 
-    async def _handle_power_on(self) -> None:
+    async def _handle_power_on(self, params: Dict[str, Any] = None) -> None:
         """Handle power on - start monitoring."""
         await self.start()
-        await self._update_current_data()
-        self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+        diff = {Attributes.STATE: self._entity.attributes[Attributes.STATE]}
+        diff.update(await self._update_current_data())
+        self._apply_and_push(diff)
 
-    async def _handle_power_off(self) -> None:
+    async def _handle_power_off(self, params: Dict[str, Any] = None) -> None:
         """Handle power off - pause monitoring."""
         await self.stop()
-        self._entity.attributes[Attributes.STATE] = States.PAUSED
-        self._api.configured_entities.update_attributes(self.entity_id, {Attributes.STATE: States.PAUSED})
+        self._apply_and_push({Attributes.STATE: States.PAUSED})
 
-    async def _handle_navigate_next(self) -> None:
+    async def _handle_navigate_next(self, params: Dict[str, Any] = None) -> None:
         await self._refresh_display()
 
-    async def _handle_navigate_previous(self) -> None:
+    async def _handle_navigate_previous(self, params: Dict[str, Any] = None) -> None:
         await self._refresh_display()
 
     async def _handle_custom_command(self, cmd_id: str, params: Dict[str, Any] = None) -> None:
-        if cmd_id in ["REFRESH_STATUS", "SYSTEM_INFO", "UPDATE_DISPLAY"]:
+        if cmd_id in _CUSTOM_COMMANDS:
             await self._refresh_display()
 
     async def _update_source_display(self) -> None:
         """Update display for current source."""
         # Set base64 icon for current source
-        icon_base64 = self._get_source_image(self._current_source)
+        icon_base64 = self._source_image_url.get(self._current_source, self._fallback_url)
         if icon_base64:
             self._entity.attributes[Attributes.MEDIA_IMAGE_URL] = icon_base64
-            _LOG.debug(f"Set base64 icon for source {self._current_source}")
-        
-        await self._update_current_data()
 
-    async def _update_current_data(self, force_refresh: bool = False) -> None:
-        """Update current data based on selected source."""
+        self._entity.attributes.update(await self._update_current_data())
+
+    async def _update_current_data(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Compute the attribute diff for the selected source.
+
+        :return: Attribute keys whose values should be pushed; empty when
+                 nothing could be fetched
+        """
         if not self._client.connected:
-            _LOG.warning("Client not connected, skipping data update")
-            return
-        
+            if self._was_connected:
+                # Push the disconnected state once on the transition; until
+                # reconnect every tick is a cheap attribute check
+                self._was_connected = False
+                _LOG.warning("Client not connected, showing disconnected state")
+                return dict(_DISCONNECTED_DIFF)
+            return {}
+        if not self._was_connected:
+            # Reconnected: drop caches so the next render repaints fully
+            self._was_connected = True
+            self._render_cache.clear()
+            self._last_pushed.clear()
+            _LOG.info("Client reconnected, forcing display refresh")
+
         # Source key mapping - handle both internal keys and display names
-        source_key = self._current_source
-        if self._current_source in self._sources.values():
-            # Convert display name back to key
-            source_key = next((key for key, name in self._sources.items() if name == self._current_source), self._current_source)
-        
-        fetcher_map = {
-            "SYSTEM_OVERVIEW": self._client.get_system_overview,
-            "STORAGE_STATUS": self._client.get_storage_status,
-            "NETWORK_STATS": self._client.get_network_stats,
-            "SERVICES_STATUS": self._client.get_services_status,
-            "SECURITY_STATUS": self._client.get_security_status,
-            "DOCKER_STATUS": self._client.get_docker_status,
-            "SURVEILLANCE_STATUS": self._client.get_surveillance_status,
-            "THERMAL_STATUS": self._client.get_thermal_status,
-            "CACHE_STATUS": self._client.get_cache_status,
-            "RAID_STATUS": self._client.get_raid_status,
-            "VOLUME_STATUS": self._client.get_volume_status,
-            "UPS_STATUS": self._client.get_ups_status,
-            # Enhanced monitoring sources
-            "HARDWARE_MONITOR": self._client.get_hardware_monitor,
-            "DRIVE_HEALTH": self._client.get_drive_health,
-            "POWER_MANAGEMENT": self._client.get_power_management,
-            "CACHE_PERFORMANCE": self._client.get_cache_performance,
-            "PACKAGE_MANAGER": self._client.get_package_manager,
-            "USER_SESSIONS": self._client.get_user_sessions,
-        }
-        
-        updater_map = {
-            "SYSTEM_OVERVIEW": self._update_system_overview_display,
-            "STORAGE_STATUS": self._update_storage_status_display,
-            "NETWORK_STATS": self._update_network_stats_display,
-            "SERVICES_STATUS": self._update_services_status_display,
-            "SECURITY_STATUS": self._update_security_status_display,
-            "DOCKER_STATUS": self._update_docker_status_display,
-            "SURVEILLANCE_STATUS": self._update_surveillance_status_display,
-            "THERMAL_STATUS": self._update_thermal_status_display,
-            "CACHE_STATUS": self._update_cache_status_display,
-            "RAID_STATUS": self._update_raid_status_display,
-            "VOLUME_STATUS": self._update_volume_status_display,
-            "UPS_STATUS": self._update_ups_status_display,
-            "HARDWARE_MONITOR": self._update_hardware_monitor_display,
-            "DRIVE_HEALTH": self._update_drive_health_display,
-            "POWER_MANAGEMENT": self._update_power_management_display,
-            "CACHE_PERFORMANCE": self._update_cache_performance_display,
-            "PACKAGE_MANAGER": self._update_package_manager_display,
-            "USER_SESSIONS": self._update_user_sessions_display,
-        }
+        source_key = self._name_to_key.get(self._current_source, self._current_source)
 
-        fetcher = fetcher_map.get(source_key)
-        updater = updater_map.get(source_key)
+        fetcher = self._fetchers.get(source_key)
+        updater = self._updaters.get(source_key)
 
         if fetcher and updater:
-            _LOG.debug(f"Fetching data for source: {source_key}")
             try:
-                data = await fetcher()
-                _LOG.debug(f"Received data for {source_key}: {data}")
-                await updater(data)
+                pending = self._inflight.get(source_key)
+                if pending is not None:
+                    data = await pending
+                else:
+                    task = asyncio.ensure_future(fetcher())
+                    self._inflight[source_key] = task
+                    try:
+                        data = await task
+                    finally:
+                        self._inflight.pop(source_key, None)
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    # %r of a large payload is only built when debug is on
+                    _LOG.debug("Received data for %s: %r", source_key, data)
+                if not data:
+                    return self._unavailable_diff.get(self._current_source, {})
+                cached = self._render_cache.get(source_key)
+                if cached is not None and cached[0] == data:
+                    return cached[1]
+                diff = updater(data)
+                self._render_cache[source_key] = (data, diff)
+                return diff
+            except (asyncio.TimeoutError, ConnectionError, OSError):
+                # Transient network trouble: propagate to the polling loop so
+                # its jittered backoff governs the retry cadence instead of
+                # rendering the unavailable diff and resetting the fail count
+                raise
             except AttributeError as ex:
                 _LOG.warning(f"Method not implemented for {source_key}: {ex}")
-                self._entity.attributes[Attributes.MEDIA_TITLE] = f"{self._current_source}"
-                self._entity.attributes[Attributes.MEDIA_ARTIST] = "Feature not available"
+                return {
+                    Attributes.MEDIA_TITLE: f"{self._current_source}",
+                    Attributes.MEDIA_ARTIST: "Feature not available"
+                }
+            except Exception as ex:
+                _LOG.warning(f"Fetch failed for {source_key}: {ex}")
+                return self._unavailable_diff.get(self._current_source, {})
         else:
             _LOG.warning(f"No fetcher/updater found for source: {source_key}")
-            self._entity.attributes[Attributes.MEDIA_TITLE] = f"{self._current_source}"
-            self._entity.attributes[Attributes.MEDIA_ARTIST] = "Coming soon"
+            return {
+                Attributes.MEDIA_TITLE: f"{self._current_source}",
+                Attributes.MEDIA_ARTIST: "Coming soon"
+            }
 
-    async def _update_system_overview_display(self, data: Dict[str, Any]) -> None:
-        if data:
-            self._entity.attributes[Attributes.STATE] = States.PLAYING if data.get('status') == "healthy" else States.PAUSED
-            line1 = f"{data.get('model', 'NAS')} - {data.get('status', '...').title()}"
-            line2 = f"CPU: {data.get('cpu_usage', 0):.1f}% | Mem: {data.get('memory_usage', 0):.1f}% | {data.get('temperature', 'N/A')}"
-            self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
-
-    async def _update_storage_status_display(self, data: Dict[str, Any]) -> None:
-        if data and data.get('total_size', 0) > 0:
-            usage_pct = (data.get('total_used', 0) / data['total_size']) * 100
-            line1 = f"Storage - {data.get('health_status', '...').title()}"
-            line2 = f"Used: {usage_pct:.1f}%"
-            self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
-
-    async def _update_network_stats_display(self, data: Dict[str, Any]) -> None:
+    def _update_system_overview_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data:
+            return {}
+        _g = data.get
+        status = _g('status', '...')
+        line1 = f"{_g('model', 'NAS')} - {status.title()}"
+        line2 = f"CPU: {_g('cpu_usage', 0):.1f}% | Mem: {_g('memory_usage', 0):.1f}% | {_g('temperature', 'N/A')}"
+        title, artist = create_two_line_display(line1, line2)
+        return {
+            Attributes.STATE: States.PLAYING if status == "healthy" else States.PAUSED,
+            Attributes.MEDIA_TITLE: title,
+            Attributes.MEDIA_ARTIST: artist
+        }
+
+    def _update_storage_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data or data.get('total_size', 0) <= 0:
+            return {}
+        usage_pct = (data.get('total_used', 0) / data['total_size']) * 100
+        line1 = f"Storage - {data.get('health_status', '...').title()}"
+        line2 = f"Used: {usage_pct:.1f}%"
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
+
+    def _update_network_stats_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update network statistics display to show live totals from utilization API."""
         if data:
             # Handle interface count properly
@@ -371,10 +596,9 @@ class SynologySystemDashboard:
             line1 = "Network data unavailable"
             line2 = "Network Statistics"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_services_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_services_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update services status display."""
         if data:
             # Use the correct data structure from client
@@ -394,35 +618,43 @@ class SynologySystemDashboard:
             line1 = "Services Status"
             line2 = "Service information unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_security_status_display(self, data: Dict[str, Any]) -> None:
-        if data:
-            firewall = "enabled" if data.get('firewall_enabled') else "disabled"
-            line1 = f"Security - {data.get('status', '...').title()}"
-            line2 = f"Issues: {data.get('issues_found', 0)} | Firewall: {firewall}"
-            self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+    def _update_security_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data:
+            return {}
+        _g = data.get
+        firewall = "enabled" if _g('firewall_enabled') else "disabled"
+        line1 = f"Security - {_g('status', '...').title()}"
+        line2 = f"Issues: {_g('issues_found', 0)} | Firewall: {firewall}"
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_docker_status_display(self, data: Dict[str, Any]) -> None:
-        if data:
-            status = data.get('status', 'unknown')
-            running_count = data.get('running_count', 0)
-            total_count = data.get('total_count', 0)
-            
-            line1 = f"Docker - {status.title()}"
-            line2 = f"Containers: {running_count}/{total_count} running"
-            
-            self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+    def _update_docker_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data:
+            return {}
+        status = data.get('status', 'unknown')
+        running_count = data.get('running_count', 0)
+        total_count = data.get('total_count', 0)
 
-    async def _update_surveillance_status_display(self, data: Dict[str, Any]) -> None:
-        if data:
-            camera_count = data.get('camera_count', 0)
-            recording_count = data.get('recording_count', 0)
-            line1 = f"Surveillance - {data.get('status', 'Unknown').title()}"
-            line2 = f"Cameras: {camera_count} | Recording: {recording_count}"
-            self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+        line1 = f"Docker - {status.title()}"
+        line2 = f"Containers: {running_count}/{total_count} running"
+
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_thermal_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_surveillance_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data:
+            return {}
+        camera_count = data.get('camera_count', 0)
+        recording_count = data.get('recording_count', 0)
+        line1 = f"Surveillance - {data.get('status', 'Unknown').title()}"
+        line2 = f"Cameras: {camera_count} | Recording: {recording_count}"
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
+
+    def _update_thermal_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update thermal status display with properly formatted temperature."""
         if data and data.get('system_temp', 0) > 0:
             status = data.get('status', 'unknown').title()
@@ -435,9 +667,10 @@ class SynologySystemDashboard:
             line1 = "Thermal Monitor"
             line2 = "Temperature sensor unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_cache_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_cache_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update SSD cache status display."""
         if data and data.get('cache_enabled', False):
             cache_usage = data.get('cache_usage', 0)
@@ -450,24 +683,24 @@ class SynologySystemDashboard:
             line1 = "No SSD cache detected or configured"
             line2 = "SSD Cache - Disabled"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_raid_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_raid_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update RAID status display with real RAID data."""
         if data:
-            raid_level = data.get('raid_level', 'unknown')
-            total_drives = data.get('total_drives', 0)
-            healthy_drives = data.get('healthy_drives', 0)
-            degraded_drives = data.get('degraded_drives', 0)
-            rebuilding = data.get('rebuilding', False)
+            _g = data.get
+            raid_level = _g('raid_level', 'unknown')
+            total_drives = _g('total_drives', 0)
+            healthy_drives = _g('healthy_drives', 0)
+            degraded_drives = _g('degraded_drives', 0)
+            rebuilding = _g('rebuilding', False)
             
             if rebuilding:
                 status_text = "Rebuilding"
             elif degraded_drives > 0:
                 status_text = "Degraded"
             else:
-                status_text = data.get('status', 'Unknown').title()
+                status_text = _g('status', 'Unknown').title()
             
             line1 = f"RAID {raid_level} - {status_text}"
             line2 = f"Drives: {healthy_drives}/{total_drives} healthy"
@@ -478,18 +711,20 @@ class SynologySystemDashboard:
             line1 = "RAID Health"
             line2 = "RAID information unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_volume_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_volume_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update volume status display."""
         if data:
-            volume_count = data.get('volume_count', 0)
-            healthy_volumes = data.get('healthy_volumes', 0)
-            warning_volumes = data.get('warning_volumes', 0)
-            critical_volumes = data.get('critical_volumes', 0)
-            avg_usage = data.get('average_usage', 0)
+            _g = data.get
+            volume_count = _g('volume_count', 0)
+            healthy_volumes = _g('healthy_volumes', 0)
+            warning_volumes = _g('warning_volumes', 0)
+            critical_volumes = _g('critical_volumes', 0)
+            avg_usage = _g('average_usage', 0)
             
-            status = data.get('status', 'unknown').title()
+            status = _g('status', 'unknown').title()
             
             line1 = f"Healthy: {healthy_volumes}/{volume_count} | Avg Usage: {avg_usage}%"
             line2 = f"Volumes - {status}"
@@ -500,21 +735,20 @@ class SynologySystemDashboard:
             line1 = "Volume information unavailable"
             line2 = "Volume Usage"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_ups_status_display(self, data: Dict[str, Any]) -> None:
+    def _update_ups_status_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update UPS status display to show model and status information."""
         if data:
-            ups_connected = data.get('ups_connected', False)
-            ups_model = data.get('ups_model', 'Unknown')
-            battery_level = data.get('battery_level', 0)
-            runtime_minutes = data.get('runtime_minutes', 0)
-            status = data.get('status', 'unknown').title()
+            _g = data.get
+            ups_connected = _g('ups_connected', False)
+            ups_model = _g('ups_model', 'Unknown')
+            battery_level = _g('battery_level', 0)
+            runtime_minutes = _g('runtime_minutes', 0)
+            status = _g('status', 'unknown').title()
             
             if ups_connected:
-                runtime_hours = runtime_minutes // 60
-                runtime_mins = runtime_minutes % 60
+                runtime_hours, runtime_mins = divmod(runtime_minutes, 60)
                 
                 if ups_model and ups_model not in ["Unknown", "Not Detected"]:
                     line1 = f"{ups_model} - {status}"  # e.g. "APC Smart-UPS 1500 - Connected"
@@ -531,15 +765,15 @@ class SynologySystemDashboard:
             line1 = "UPS Monitor"
             line2 = "UPS information unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_hardware_monitor_display(self, data: Dict[str, Any]) -> None:
+    def _update_hardware_monitor_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update hardware monitoring display with properly formatted temperatures."""
         if data:
-            cpu_temp_formatted = data.get('cpu_temp_formatted', data.get('cpu_temp', 0))
-            drive_count = data.get('monitored_drives', 0)
-            avg_temp_formatted = data.get('average_drive_temp_formatted', data.get('average_drive_temp', 0))
+            _g = data.get
+            cpu_temp_formatted = _g('cpu_temp_formatted', _g('cpu_temp', 0))
+            drive_count = _g('monitored_drives', 0)
+            avg_temp_formatted = _g('average_drive_temp_formatted', _g('average_drive_temp', 0))
             
             # Handle case where we get numeric value instead of formatted string
             if isinstance(cpu_temp_formatted, (int, float)):
@@ -548,15 +782,14 @@ class SynologySystemDashboard:
                 avg_temp_formatted = f"{avg_temp_formatted}°C"
             
             line1 = f"CPU: {cpu_temp_formatted} | {drive_count} drives | Avg: {avg_temp_formatted}"
-            line2 = f"Hardware - {data.get('status', 'Unknown').title()}"
+            line2 = f"Hardware - {_g('status', 'Unknown').title()}"
         else:
             line1 = "Hardware data unavailable"
             line2 = "Hardware Monitor"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_drive_health_display(self, data: Dict[str, Any]) -> None:
+    def _update_drive_health_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update drive health display."""
         if data:
             total_drives = data.get('total_drives', 0)
@@ -572,11 +805,13 @@ class SynologySystemDashboard:
             line1 = "Drive Health"
             line2 = "Drive health data unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE], self._entity.attributes[Attributes.MEDIA_ARTIST] = create_two_line_display(line1, line2)
+        title, artist = create_two_line_display(line1, line2)
+        return {Attributes.MEDIA_TITLE: title, Attributes.MEDIA_ARTIST: artist}
 
-    async def _update_power_management_display(self, data: Dict[str, Any]) -> None:
+    def _update_power_management_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update power management display with properly formatted temperature."""
-        if data and data.get('status') == 'active':
+        status = data.get('status') if data else None
+        if status == 'active':
             line1 = data.get('detailed_info', 'Power management loading...')
             
             ups_connected = data.get('ups_connected', False)
@@ -585,11 +820,11 @@ class SynologySystemDashboard:
             else:
                 line2 = "Not Connected"
                 
-        elif data and data.get('status') == 'api_error':
+        elif status == 'api_error':
             line1 = data.get('detailed_info', 'Power Management API error - check connection')
             line2 = "API Error"
             
-        elif data and data.get('status') == 'error':
+        elif status == 'error':
             error_msg = data.get('error', 'Unknown error')
             line1 = f"Power Management Error: {error_msg}"
             line2 = "Error"
@@ -598,20 +833,20 @@ class SynologySystemDashboard:
             line1 = "Power Management unavailable - NAS not connected"
             line2 = "Unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_cache_performance_display(self, data: Dict[str, Any]) -> None:
+    def _update_cache_performance_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update cache performance display with SSD cache data."""
-        if data and data.get('status') in ['active', 'disabled']:
+        status = data.get('status') if data else None
+        if status in ('active', 'disabled'):
             line1 = data.get('detailed_info', 'Cache performance loading...')
             line2 = data.get('short_status', 'Cache Performance')
             
-        elif data and data.get('status') == 'api_error':
+        elif status == 'api_error':
             line1 = data.get('detailed_info', 'Cache Performance API error - check storage access')
             line2 = "API Error"
             
-        elif data and data.get('status') == 'error':
+        elif status == 'error':
             error_msg = data.get('error', 'Unknown error')
             line1 = f"Cache Performance Error: {error_msg}"
             line2 = "Error"
@@ -620,19 +855,19 @@ class SynologySystemDashboard:
             line1 = "Cache performance unavailable - NAS not connected"
             line2 = "Unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_package_manager_display(self, data: Dict[str, Any]) -> None:
+    def _update_package_manager_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update package manager display with installed package counts."""
-        if data and data.get('status') in ['active', 'healthy']:
+        status = data.get('status') if data else None
+        if status in ('active', 'healthy'):
             installed_packages = data.get('installed_packages', 0)
             running_packages = data.get('running_packages', 0)
             updates_available = data.get('updates_available', 0)
             package_names = data.get('package_names', [])
             
-            major_packages = [name for name in package_names if not name.startswith('SYNO.Core') and not name.startswith('SYNO.API')]
-            major_count = len(major_packages)
+            major_count = sum(1 for name in package_names
+                              if not name.startswith(_SYS_PREFIXES))
             
             line1 = f"Installed: {installed_packages} | Running: {running_packages} | Major: {major_count}"
             line2 = "Package Manager"
@@ -640,15 +875,15 @@ class SynologySystemDashboard:
             if updates_available > 0:
                 line1 += f" | Updates: {updates_available}"
                 
-        elif data and data.get('status') == 'api_error':
+        elif status == 'api_error':
             line1 = "Package Manager API error - check services access"
             line2 = "API Error"
             
-        elif data and data.get('status') == 'no_data':
+        elif status == 'no_data':
             line1 = "No package data available from NAS"
             line2 = "No Data"
             
-        elif data and data.get('status') == 'error':
+        elif status == 'error':
             error_msg = data.get('error', 'Unknown error')
             line1 = f"Package Manager Error: {error_msg}"
             line2 = "Error"
@@ -657,10 +892,9 @@ class SynologySystemDashboard:
             line1 = "Package manager unavailable - NAS not connected"
             line2 = "Unavailable"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
-    async def _update_user_sessions_display(self, data: Dict[str, Any]) -> None:
+    def _update_user_sessions_display(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update user sessions display."""
         if data:
             active_sessions = data.get('active_sessions', 0)
@@ -671,46 +905,180 @@ class SynologySystemDashboard:
             line2 = f"User Sessions - {data.get('status', 'Unknown').title()}"
             
             if session_duration > 0:
-                hours = session_duration // 60
-                mins = session_duration % 60
+                hours, mins = divmod(session_duration, 60)
                 line1 += f" | Avg: {hours}h{mins}m"
         else:
             line1 = "Session data unavailable"
             line2 = "User Sessions"
         
-        self._entity.attributes[Attributes.MEDIA_TITLE] = line1
-        self._entity.attributes[Attributes.MEDIA_ARTIST] = line2
+        return {Attributes.MEDIA_TITLE: line1, Attributes.MEDIA_ARTIST: line2}
 
     async def _refresh_display(self) -> None:
-        """Force refresh of current display."""
-        await self._update_current_data(force_refresh=True)
-        self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
+        """Force refresh of current display.
+
+        Routed through the polling loop's wake event so a manual refresh and
+        the loop never fetch concurrently; the loop re-polls immediately and
+        pushes the result.
+        """
+        self._backoff.pop(self._name_to_key.get(self._current_source, self._current_source), None)
+        if self._polling_task and not self._polling_task.done():
+            self._wake.set()
+        else:
+            self._apply_and_push(await self._update_current_data(force_refresh=True))
 
     async def _polling_loop(self) -> None:
-        """Main polling loop for data updates - HTCP exact pattern."""
+        """Polling loop with per-source adaptive intervals.
+
+        Only the selected source is polled; its interval starts at the
+        per-source base and doubles (capped) while consecutive renders stay
+        identical, resetting on change or source switch.
+        """
         _LOG.info("Polling loop started.")
-        while True:
+        # Bound locals for the per-tick lookups; these never change while
+        # the loop is alive
+        name_to_key = self._name_to_key.get
+        wake_wait = self._wake.wait
+        while not self._shutdown.is_set():
             try:
-                await self._update_current_data()
-                self._api.configured_entities.update_attributes(self.entity_id, self._entity.attributes)
-                interval = self._config.polling_intervals.get(self._current_source.lower(), 15)
-                await asyncio.sleep(interval)
+                source_key = name_to_key(self._current_source, self._current_source)
+                diff = await self._update_current_data()
+                changed = bool(diff) and diff != self._last_pushed.get(self._current_source)
+                self._apply_and_push(diff)
+                self._fail_count = 0
+                if self._recent_sources and self._client.connected:
+                    await self._prefetch_recent()
+
+                base = _BASE_INTERVALS.get(source_key, _DEFAULT_INTERVAL)
+                if not self._client.connected:
+                    # No point polling a dead client at the source's cadence
+                    self._backoff[source_key] = _DISCONNECTED_INTERVAL
+                elif changed:
+                    if self._backoff.get(source_key, base) > base:
+                        _LOG.debug("Source %s changed, back to fast polling (%ss)",
+                                   source_key, base)
+                    self._backoff[source_key] = base
+                else:
+                    prev = self._backoff.get(source_key, base)
+                    if prev == base:
+                        _LOG.debug("Source %s unchanged, entering slow polling", source_key)
+                    self._backoff[source_key] = min(_MAX_BACKOFF, prev * 2)
+                try:
+                    await asyncio.wait_for(wake_wait(), timeout=self._backoff[source_key])
+                    self._wake.clear()
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 _LOG.info("Polling loop cancelled.")
                 break
+            except (asyncio.TimeoutError, ConnectionError, OSError) as ex:
+                # Transient network trouble: exponential backoff with jitter
+                # so several Remotes don't retry a rebooting NAS in lockstep
+                self._fail_count += 1
+                delay = min(30.0, 2.0 ** self._fail_count)
+                delay += random.uniform(0, delay * 0.25)
+                _LOG.warning("Transient error in polling loop (attempt %d): %s; "
+                             "retrying in %.1fs", self._fail_count, ex, delay)
+                await asyncio.sleep(delay)
             except Exception as ex:
-                _LOG.error(f"Error in polling loop: {ex}")
+                _LOG.error(f"Error in polling loop: {ex}", exc_info=True)
                 await asyncio.sleep(30)
 
+    async def _prefetch_recent(self) -> None:
+        """Warm the client's endpoint cache for recently viewed sources.
+
+        Fetches run concurrently under the semaphore; results are discarded
+        here, so switching back to a recent source renders from cache
+        instead of waiting out a fresh HTTPS round-trip.
+        """
+        async def warm(name: str) -> None:
+            fetcher = self._fetchers.get(self._name_to_key.get(name, name))
+            if fetcher is None:
+                return
+            async with self._fetch_sem:
+                try:
+                    await fetcher()
+                except Exception as ex:
+                    _LOG.debug("Prefetch for %s failed: %s", name, ex)
+
+        await asyncio.gather(*(warm(name) for name in self._recent_sources
+                               if name != self._current_source))
+
+    def _local_ip_for_remote(self) -> str:
+        """Determine the local address the remote can reach us on."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect((self._client._host, 1))
+                return sock.getsockname()[0]
+        except OSError:
+            return ""
+
+    async def _start_icon_server(self) -> None:
+        """Serve the icons directory over local HTTP if enabled and possible.
+
+        A ~40-byte http URL in MEDIA_IMAGE_URL replaces the ~20 KB base64
+        data URL in every attribute push; falls back to data URLs whenever
+        the server cannot run.
+        """
+        if self._http_runner or not AIOHTTP_AVAILABLE:
+            return
+        if not self._config.enabled_features.get("snapshot_http_server", False):
+            return
+
+        host_ip = self._local_ip_for_remote()
+        if not host_ip:
+            _LOG.warning("Could not determine local IP - icon server disabled")
+            return
+
+        try:
+            app = web.Application()
+            app.router.add_static("/icons/", _ICON_DIR)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "0.0.0.0", _ICON_SERVER_PORT)
+            await site.start()
+            self._http_runner = runner
+            self._http_base_url = f"http://{host_ip}:{_ICON_SERVER_PORT}"
+            self._fallback_url = f"{self._http_base_url}/icons/synology_logo.png"
+            self._source_image_url = {
+                name: f"{self._http_base_url}/icons/{_SOURCE_IMAGES.get(name, 'synology_logo.png')}"
+                for name in self._sources.values()
+            }
+            _LOG.info(f"Icon HTTP server listening at {self._http_base_url}")
+        except Exception as ex:
+            _LOG.warning(f"Icon HTTP server failed to start, using data URLs: {ex}")
+            self._http_runner = None
+            self._http_base_url = None
+
+    async def _stop_icon_server(self) -> None:
+        """Stop the icon HTTP server and revert to data URLs."""
+        if self._http_runner:
+            try:
+                await self._http_runner.cleanup()
+            except Exception as ex:
+                _LOG.debug(f"Error stopping icon server: {ex}")
+            self._http_runner = None
+            self._http_base_url = None
+            self._source_image_url = dict(self._data_image_url)
+            self._fallback_url = self._data_fallback_url
+
     async def start(self) -> None:
         """Start the system dashboard's polling loop."""
         if not self._polling_task or self._polling_task.done():
             if self._client.connected:
+                await self._start_icon_server()
+                self._shutdown.clear()
                 self._entity.attributes[Attributes.STATE] = States.PLAYING
                 self._polling_task = asyncio.create_task(self._polling_loop())
 
     async def stop(self) -> None:
-        """Stop the system dashboard."""
+        """Stop the system dashboard.
+
+        Signals the shutdown event first so the polling loop exits at its
+        next checkpoint, then cancels it and any in-flight fetches and waits
+        for them, guaranteeing no task outlives the dashboard.
+        """
+        self._shutdown.set()
+        self._wake.set()
         if self._polling_task and not self._polling_task.done():
             self._polling_task.cancel()
             try:
@@ -718,6 +1086,12 @@ class SynologySystemDashboard:
             except asyncio.CancelledError:
                 pass
             self._polling_task = None
+        if self._inflight:
+            for task in self._inflight.values():
+                task.cancel()
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+            self._inflight.clear()
+        await self._stop_icon_server()
 
     @property
     def entity(self) -> MediaPlayer:
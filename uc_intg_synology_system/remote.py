@@ -17,10 +17,36 @@ from uc_intg_synology_system.config import SynologyConfig
 
 _LOG = logging.getLogger(__name__)
 
+# Entity definition is static; built once at module level instead of fresh
+# lists per construction (reconfigure / placeholder swap)
+_FEATURES = (Features.ON_OFF, Features.SEND_CMD)
+
+# ONLY FUNCTIONAL COMMANDS
+_SIMPLE_COMMANDS = (
+    "BEEP_ON",           # Uses enable_beep_control(True)
+    "BEEP_OFF",          # Uses enable_beep_control(False)
+    "SYSTEM_RESTART",    # Uses reboot() - requires confirmation
+    "SYSTEM_SHUTDOWN"    # Uses shutdown() - requires confirmation
+)
+
+# Command -> (SysInfo method name, args, warn, log message). Resolved with
+# getattr at call time so placeholder remotes whose client arrives later
+# via update_client dispatch correctly
+_CMD_TABLE = {
+    "BEEP_ON": ("enable_beep_control", (True,), False, "Activating NAS beep"),
+    "BEEP_OFF": ("enable_beep_control", (False,), False, "Deactivating NAS beep"),
+    "SYSTEM_RESTART": ("reboot", (), True,
+                       "SYSTEM RESTART REQUESTED - This will reboot your NAS!"),
+    "SYSTEM_SHUTDOWN": ("shutdown", (), True,
+                        "SYSTEM SHUTDOWN REQUESTED - This will shutdown your NAS!"),
+}
+
 
 class SynologySystemRemote:
     """Synology System control remote entity with placeholder support."""
 
+    __slots__ = ("_api", "_client", "_config", "_entity")
+
     def __init__(self, api: ucapi.IntegrationAPI, client: Optional[SynologySystemClient], config: SynologyConfig):
         """
         Initialize system remote - supports None client for placeholders.
@@ -39,25 +65,16 @@ class SynologySystemRemote:
 
     def _create_remote_entity(self) -> Remote:
         """Create remote entity with only working commands."""
-        features = [Features.ON_OFF, Features.SEND_CMD]
-        
         # CRITICAL: Initialize with proper state attribute for reboot survival
         attributes = {Attributes.STATE: States.OFF}
-        
-        # ONLY FUNCTIONAL COMMANDS
-        simple_commands = [
-            "BEEP_ON",           # Uses enable_beep_control(True)
-            "BEEP_OFF",          # Uses enable_beep_control(False) 
-            "SYSTEM_RESTART",    # Uses reboot() - requires confirmation
-            "SYSTEM_SHUTDOWN"    # Uses shutdown() - requires confirmation
-        ]
-        
+
+        # ucapi may mutate the passed containers, so hand over fresh lists
         return Remote(
             identifier="synology_system_remote",
             name="Synology System Control",
-            features=features,
+            features=list(_FEATURES),
             attributes=attributes,
-            simple_commands=simple_commands,
+            simple_commands=list(_SIMPLE_COMMANDS),
             cmd_handler=self.handle_command
         )
 
@@ -101,31 +118,20 @@ class SynologySystemRemote:
             _LOG.error("Cannot execute command - client not available or not connected")
             return False
         
+        entry = _CMD_TABLE.get(command)
+        if entry is None:
+            _LOG.warning(f"Unknown command: {command}")
+            return False
+
+        method_name, args, warn, message = entry
+        (_LOG.warning if warn else _LOG.info)(message)
         try:
-            if command == "BEEP_ON":
-                _LOG.info("Activating NAS beep")
-                self._client._sys_info.enable_beep_control(True)
-                return True
-                
-            elif command == "BEEP_OFF":
-                _LOG.info("Deactivating NAS beep")
-                self._client._sys_info.enable_beep_control(False)
-                return True
-                
-            elif command == "SYSTEM_RESTART":
-                _LOG.warning("SYSTEM RESTART REQUESTED - This will reboot your NAS!")
-                self._client._sys_info.reboot()
-                return True
-                
-            elif command == "SYSTEM_SHUTDOWN":
-                _LOG.warning("SYSTEM SHUTDOWN REQUESTED - This will shutdown your NAS!")
-                self._client._sys_info.shutdown()
-                return True
-                
-            else:
-                _LOG.warning(f"Unknown command: {command}")
-                return False
-                
+            # synology-api calls are blocking HTTPS requests; run them on the
+            # client's executor so the event loop keeps servicing polls
+            await self._client._run_blocking(
+                getattr(self._client._sys_info, method_name), *args
+            )
+            return True
         except Exception as ex:
             _LOG.error(f"Error executing command '{command}': {ex}")
             return False